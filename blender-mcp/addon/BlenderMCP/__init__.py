@@ -7,22 +7,253 @@ commands from the MCP server and executes them in Blender's context.
 bl_info = {
     "name": "Blender MCP Bridge",
     "author": "CaiD Team",
-    "version": (0, 1, 0),
+    "version": (0, 2, 0),
     "blender": (4, 0, 0),
     "location": "View3D > Sidebar > MCP",
     "description": "Socket server for AI-assisted 3D modeling",
     "category": "Development",
 }
 
+import asyncio
 import bpy
+import bmesh
+import collections
+import contextlib
+import functools
+import gpu
 import json
 import socket
+import struct
 import threading
+import zlib
 import math
+import mathutils
+import os
 import tempfile
-import base64
 from pathlib import Path
 
+import numpy as np
+
+# orjson parses bytes directly and is several times faster on large
+# payloads (screenshots, execute_code bodies); stdlib json is the fallback.
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        # Tool results may carry numpy arrays/scalars; orjson encodes them natively
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# uvloop (libuv) is a faster drop-in event loop where it is installed;
+# asyncio's selector loop is the fallback.
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# Wire format (since 0.2.0): each message is a 4-byte little-endian
+# length followed by that many bytes of JSON, in both directions. A
+# response with "binary_size" is followed by one more frame holding that
+# many raw bytes (e.g. screenshot PNG data). A connection may carry any
+# number of request/response exchanges.
+HEADER_SIZE = 4
+# Larger requests are refused before any buffer is allocated for them
+MAX_MSG_SIZE = 64 * 1024 * 1024
+
+# Binary STL record: normal, three vertices, attribute byte count
+STL_TRIANGLE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("verts", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])
+
+
+def _write_binary_stl(obj, file_path: str, apply_modifiers: bool) -> None:
+    """Write obj to a binary STL in world space straight from its triangle data."""
+    if apply_modifiers:
+        obj = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = obj.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+        tri_count = len(mesh.loop_triangles)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        tris = np.empty(tri_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+    finally:
+        obj.to_mesh_clear()
+
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    tris = tris.reshape(-1, 3)
+    if np.linalg.det(matrix[:3, :3]) < 0:
+        # Mirrored transform: flip winding so normals still point outward
+        tris = tris[:, ::-1]
+    verts = co[tris]
+    normals = np.cross(verts[:, 1] - verts[:, 0], verts[:, 2] - verts[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    records = np.zeros(tri_count, dtype=STL_TRIANGLE)
+    records["normal"] = normals
+    records["verts"] = verts
+    with open(file_path, "wb") as f:
+        f.write(b"Blender MCP".ljust(80, b"\0"))
+        f.write(np.uint32(tri_count).tobytes())
+        records.tofile(f)
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def _encode_png(rgba: np.ndarray, width: int, height: int) -> bytes:
+    """Encode bottom-up RGBA pixels (GPU readback order) as an RGB PNG."""
+    rows = rgba.reshape(height, width, 4)[::-1, :, :3].reshape(height, width * 3)
+    # Filter byte 0 (None) in front of every scanline
+    raw = np.hstack((np.zeros((height, 1), dtype=np.uint8), rows)).tobytes()
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(raw, 1))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def _find_view3d():
+    """Return the first 3D viewport (space, region), or (None, None) when headless."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                for region in area.regions:
+                    if region.type == "WINDOW":
+                        return area.spaces.active, region
+    return None, None
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_cached(code: str):
+    """Compile an execute_code snippet once; agents often resend the same one."""
+    return compile(code, "<mcp>", "exec")
+
+
+def _set_first_material(obj, mat) -> None:
+    """Put mat in obj's first material slot, skipping the write if it is already there."""
+    slots = obj.data.materials
+    if len(slots) == 0:
+        slots.append(mat)
+    elif slots[0] != mat:
+        slots[0] = mat
+
+
+def _select_indices(elements, indices) -> None:
+    """Select exactly the given indices of a mesh element collection."""
+    mask = np.zeros(len(elements), dtype=bool)
+    idx = np.asarray(indices, dtype=np.int64)
+    mask[idx[(idx >= 0) & (idx < len(elements))]] = True
+    elements.foreach_set("select", mask)
+
+
+def _select_only_edges(mesh, indices) -> None:
+    """Select exactly the given edges, clearing vertex and face selection."""
+    mesh.vertices.foreach_set("select", np.zeros(len(mesh.vertices), dtype=bool))
+    mesh.polygons.foreach_set("select", np.zeros(len(mesh.polygons), dtype=bool))
+    _select_indices(mesh.edges, indices)
+
+
+async def _read_message(reader: asyncio.StreamReader) -> bytes:
+    """Read one length-prefixed message."""
+    size = int.from_bytes(await reader.readexactly(HEADER_SIZE), "little")
+    if size > MAX_MSG_SIZE:
+        raise ValueError(f"Message too large: {size} bytes (limit {MAX_MSG_SIZE})")
+    return await reader.readexactly(size)
+
+
+def _write_message(writer: asyncio.StreamWriter, payload: bytes):
+    """Queue one length-prefixed message on the transport as a single vectored write."""
+    writer.writelines((len(payload).to_bytes(HEADER_SIZE, "little"), payload))
+
+
+# Screenshots are written to tmpfs when available, so the PNG round-trip
+# never touches the disk (tempfile's default dir otherwise)
+SCREENSHOT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# RGBA scratch buffer for BSDF base colors; alpha stays 1.0. Tools only
+# run on the main thread, so one shared buffer is enough.
+_COLOR_BUF = np.ones(4, dtype=np.float32)
+
+# Name -> ID caches in front of bpy.data lookups. Entries are checked by
+# name on every hit and the caches are dropped whenever objects may have
+# been added, removed or freed (collection changes, undo/redo, file load).
+_OBJECT_CACHE = {}
+_MATERIAL_CACHE = {}
+
+
+def _lookup(collection, cache: dict, name: str):
+    """collection.get(name), served from cache while the cached ID is valid."""
+    item = cache.get(name)
+    if item is not None:
+        try:
+            if item.name == name:
+                return item
+        except ReferenceError:
+            pass
+    item = collection.get(name)
+    if item is not None:
+        cache[name] = item
+    else:
+        cache.pop(name, None)
+    return item
+
+
+def _get_object(name: str):
+    return _lookup(bpy.data.objects, _OBJECT_CACHE, name)
+
+
+def _get_material(name: str):
+    return _lookup(bpy.data.materials, _MATERIAL_CACHE, name)
+
+
+# Responses of read-only tools, keyed by (tool, canonical JSON args). Any
+# other tool call or any depsgraph update may change what they report, so
+# either one empties the cache.
+_CACHEABLE_TOOLS = frozenset({"get_objects"})
+_RESULT_CACHE = collections.OrderedDict()
+_RESULT_CACHE_SIZE = 256
+
+
+@bpy.app.handlers.persistent
+def _clear_id_caches(*args):
+    _OBJECT_CACHE.clear()
+    _MATERIAL_CACHE.clear()
+    _RESULT_CACHE.clear()
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    _RESULT_CACHE.clear()
+    # Linking or unlinking an object always updates its collection
+    if depsgraph.id_type_updated("COLLECTION"):
+        _clear_id_caches()
+
+
+_CACHE_RESET_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.undo_post, _clear_id_caches),
+    (bpy.app.handlers.redo_post, _clear_id_caches),
+    (bpy.app.handlers.load_post, _clear_id_caches),
+)
+
 # Global server instance
 _server = None
 _server_thread = None
@@ -31,88 +262,155 @@ _server_thread = None
 class BlenderMCPServer:
     """Socket server for Blender modeling operations."""
     
+    __slots__ = (
+        "host",
+        "port",
+        "running",
+        "server_socket",
+        "_loop",
+        "_stop_event",
+        "_edit_depth",
+        "_deferred",
+        "_dispatch",
+        "_offscreen_cache",
+    )
+    
     def __init__(self, host: str = "localhost", port: int = 9876):
         self.host = host
         self.port = port
         self.running = False
         self.server_socket = None
+        self._loop = None
+        self._stop_event = None
+        self._edit_depth = 0
+        # Names of meshes whose update() is held back between begin_batch
+        # and end_batch; None when updates are applied immediately
+        self._deferred = None
+        self._offscreen_cache = {}
+        self._dispatch = {
+            name[len("_tool_"):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_tool_")
+        }
         
     def start(self):
         """Start the socket server."""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
-        self.server_socket.settimeout(1.0)
+        try:
+            self.server_socket.bind((self.host, self.port))
+            self.server_socket.listen(5)
+        except OSError:
+            self.server_socket.close()
+            self.server_socket = None
+            raise
+        self.server_socket.setblocking(False)
+        # One event loop multiplexes every client connection on the server
+        # thread. Tools themselves still run one at a time on Blender's main
+        # thread via bpy.app.timers.
+        self._loop = _new_event_loop()
+        self._stop_event = asyncio.Event()
         self.running = True
         print(f"Blender MCP Server started on {self.host}:{self.port}")
         
     def stop(self):
         """Stop the socket server."""
-        self.running = False
-        if self.server_socket:
-            self.server_socket.close()
-            self.server_socket = None
+        if self.running:
+            self.running = False
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        self._offscreen_cache.clear()
         print("Blender MCP Server stopped")
         
     def serve(self):
-        """Main server loop."""
-        while self.running:
-            try:
-                client, addr = self.server_socket.accept()
-                self._handle_client(client)
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.running:
-                    print(f"Server error: {e}")
+        """Main server loop; runs the event loop until stop() is called."""
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._serve())
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+            
+    async def _serve(self):
+        server = await asyncio.start_server(self._handle_client, sock=self.server_socket)
+        try:
+            await self._stop_event.wait()
+        finally:
+            server.close()
+            self.server_socket = None
                     
-    def _handle_client(self, client: socket.socket):
-        """Handle a client connection."""
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle a client connection, serving requests until the client disconnects."""
         try:
-            # Receive data
-            data = b""
             while True:
-                chunk = client.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if data.endswith(b"\n"):
-                    break
-                    
-            if data:
-                # Parse command
-                command = json.loads(data.decode("utf-8"))
-                
-                # Execute in main thread via timer
-                result = {"pending": True}
-                
-                def execute():
-                    nonlocal result
-                    result = self._execute_tool(command)
-                    return None  # Don't repeat
-                    
-                bpy.app.timers.register(execute, first_interval=0.0)
-                
-                # Wait for result (with timeout)
-                import time
-                timeout = 30.0
-                start = time.time()
-                while result.get("pending") and (time.time() - start) < timeout:
-                    time.sleep(0.1)
-                    
-                if result.get("pending"):
-                    result = {"success": False, "error": "Timeout waiting for execution"}
-                    
-                # Send response
-                response = json.dumps(result) + "\n"
-                client.sendall(response.encode("utf-8"))
+                try:
+                    data = await _read_message(reader)
+                except asyncio.IncompleteReadError:
+                    break  # Client disconnected
+                await self._respond(writer, data)
                 
+        except asyncio.CancelledError:
+            pass  # Server stopping
         except Exception as e:
-            error_response = json.dumps({"success": False, "error": str(e)}) + "\n"
-            client.sendall(error_response.encode("utf-8"))
+            # Framing is lost (e.g. oversize message): report and hang up
+            _write_message(writer, _json_dumps({"success": False, "error": str(e)}))
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
         finally:
-            client.close()
+            writer.close()
+            
+    async def _respond(self, writer: asyncio.StreamWriter, data: bytes):
+        """Run one request and write its response frame(s)."""
+        try:
+            command = _json_loads(data)
+            result = await self._run_on_main_thread(command)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+            
+        # Raw bytes returned by a tool travel as a second frame
+        # instead of base64 inside the JSON
+        binary = None
+        if isinstance(result.get("result"), dict):
+            binary = result["result"].pop("_binary", None)
+        if binary is not None:
+            result["binary_size"] = len(binary)
+            
+        # Send response
+        _write_message(writer, _json_dumps(result))
+        if binary is not None:
+            _write_message(writer, binary)
+        await writer.drain()
+            
+    async def _run_on_main_thread(self, command: dict) -> dict:
+        """Execute a tool in Blender's main thread via a timer and await the result."""
+        # A batch gets the per-call limit for every command it carries
+        timeout = 30.0
+        if command.get("tool") == "batch":
+            timeout *= max(1, len(command.get("arguments", {}).get("commands", ())))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(result):
+            if not future.done():
+                future.set_result(result)
+        
+        def execute():
+            result = self._execute_tool(command)
+            try:
+                loop.call_soon_threadsafe(resolve, result)
+            except RuntimeError:
+                pass  # Server stopped while the tool was running
+            return None  # Don't repeat
+            
+        bpy.app.timers.register(execute, first_interval=0.0)
+        
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return {"success": False, "error": "Timeout waiting for execution"}
             
     def _execute_tool(self, command: dict) -> dict:
         """Execute a modeling tool."""
@@ -120,18 +418,157 @@ class BlenderMCPServer:
             tool_name = command.get("tool")
             args = command.get("arguments", {})
             
-            handler = getattr(self, f"_tool_{tool_name}", None)
+            if tool_name in _CACHEABLE_TOOLS:
+                key = (tool_name, json.dumps(args, sort_keys=True))
+                cached = _RESULT_CACHE.get(key)
+                if cached is not None:
+                    _RESULT_CACHE.move_to_end(key)
+                    return cached
+            else:
+                key = None
+                _RESULT_CACHE.clear()
+            
+            handler = self._dispatch.get(tool_name)
             if handler:
                 result = handler(args)
-                return {"success": True, "result": result}
+                response = {"success": True, "result": result}
+                if key is not None:
+                    _RESULT_CACHE[key] = response
+                    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                        _RESULT_CACHE.popitem(last=False)
+                return response
             else:
                 return {"success": False, "error": f"Unknown tool: {tool_name}"}
                 
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    @contextlib.contextmanager
+    def _edit(self, obj):
+        """Hold obj in edit mode; the outermost exit restores the mode obj had."""
+        initial_mode = obj.mode
+        if bpy.context.view_layer.objects.active != obj or obj.mode != "EDIT":
+            if bpy.context.mode != "OBJECT":
+                bpy.ops.object.mode_set(mode="OBJECT")
+            bpy.context.view_layer.objects.active = obj
+            bpy.ops.object.mode_set(mode="EDIT")
+        self._edit_depth += 1
+        try:
+            yield
+        finally:
+            self._edit_depth -= 1
+            if self._edit_depth == 0 and obj.mode != initial_mode:
+                bpy.ops.object.mode_set(mode=initial_mode)
+    
+    @contextlib.contextmanager
+    def _bmesh(self, obj):
+        """Yield a BMesh for obj, editing the live edit mesh if one is open."""
+        if obj.mode == "EDIT":
+            bm = bmesh.from_edit_mesh(obj.data)
+            yield bm
+            bmesh.update_edit_mesh(obj.data)
+        else:
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(obj.data)
+                yield bm
+                bm.to_mesh(obj.data)
+                self._mesh_changed(obj.data)
+            finally:
+                bm.free()
+    
+    def _mesh_changed(self, mesh):
+        """Tag a mesh for re-evaluation now, or at end_batch if one is open."""
+        if self._deferred is None:
+            mesh.update()
+        else:
+            self._deferred.add(mesh.name)
+    
+    def _apply_deferred(self) -> int:
+        """Run the mesh updates held back so far; returns how many meshes changed."""
+        if not self._deferred:
+            return 0
+        count = len(self._deferred)
+        for name in self._deferred:
+            mesh = bpy.data.meshes.get(name)
+            if mesh:
+                mesh.update()
+        self._deferred.clear()
+        bpy.context.view_layer.update()
+        return count
+    
+    def _bevel(self, obj, edge_indices, offset: float, segments: int, profile: float):
+        """Bevel the given edges of obj (all edges if empty) with bmesh.ops."""
+        with self._bmesh(obj) as bm:
+            if edge_indices:
+                bm.edges.ensure_lookup_table()
+                count = len(bm.edges)
+                geom = [bm.edges[i] for i in edge_indices if 0 <= i < count]
+            else:
+                geom = bm.edges[:]
+            bmesh.ops.bevel(
+                bm,
+                geom=geom,
+                offset=offset,
+                offset_type="OFFSET",
+                segments=segments,
+                profile=profile,
+                affect="EDGES",
+                # Same as bevel_batch's mesh.bevel: no self-intersection on
+                # large offsets, new edges slide along existing loops
+                clamp_overlap=True,
+                loop_slide=True,
+            )
+    
     # ===== Tool Implementations =====
     
+    def _tool_batch(self, args: dict) -> dict:
+        """Run several tools in one round-trip, sharing a single edit-mode session.
+
+        With "isolated", each command instead runs exactly as if it had
+        been sent on its own; the MCP server uses this when it combines
+        concurrent calls from unrelated callers.
+        """
+        results = []
+        if args.get("isolated"):
+            for command in args["commands"]:
+                result = self._execute_tool(command)
+                if isinstance(result.get("result"), dict):
+                    result["result"].pop("_binary", None)
+                results.append(result)
+            return {"results": results}
+        owns_deferral = self._deferred is None
+        if owns_deferral:
+            self._deferred = set()
+        self._edit_depth += 1
+        try:
+            for command in args["commands"]:
+                result = self._execute_tool(command)
+                # Binary payloads can only ride on a top-level response
+                if isinstance(result.get("result"), dict):
+                    result["result"].pop("_binary", None)
+                results.append(result)
+        finally:
+            self._edit_depth -= 1
+            if self._edit_depth == 0 and bpy.context.mode != "OBJECT":
+                bpy.ops.object.mode_set(mode="OBJECT")
+            if owns_deferral:
+                self._apply_deferred()
+                self._deferred = None
+        return {"results": results}
+    
+    def _tool_begin_batch(self, args: dict) -> dict:
+        """Hold back mesh updates until end_batch."""
+        if self._deferred is None:
+            self._deferred = set()
+        return {"deferring": True}
+    
+    def _tool_end_batch(self, args: dict) -> dict:
+        """Apply mesh updates held back since begin_batch in one scene update."""
+        updated = self._apply_deferred()
+        self._deferred = None
+        return {"meshes_updated": updated}
+    
     def _tool_create_primitive(self, args: dict) -> dict:
         """Create a primitive mesh."""
         shape = args["shape"]
@@ -139,25 +576,52 @@ class BlenderMCPServer:
         location = tuple(args.get("location", [0, 0, 0]))
         size = args.get("size", 1)
         
+        if bpy.context.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        
+        # Copy a cached template mesh instead of running the primitive operator
+        mesh = self._primitive_template(shape, size).copy()
+        mesh.name = name
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = location
+        bpy.context.collection.objects.link(obj)
+        
+        # Match the operator: the new object is the only selection and active
+        for selected in bpy.context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        
+        return {"object": obj.name, "type": shape}
+    
+    def _primitive_template(self, shape: str, size: float):
+        """Return the orphan template mesh for a primitive, building it once."""
+        template_name = f".mcp_{shape}_{size}"
+        mesh = bpy.data.meshes.get(template_name)
+        if mesh is not None:
+            return mesh
+        
         if shape == "Cube":
-            bpy.ops.mesh.primitive_cube_add(size=size * 2, location=location)
+            bpy.ops.mesh.primitive_cube_add(size=size * 2)
         elif shape == "Sphere":
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=size, location=location)
+            bpy.ops.mesh.primitive_uv_sphere_add(radius=size)
         elif shape == "Cylinder":
-            bpy.ops.mesh.primitive_cylinder_add(radius=size, depth=size * 2, location=location)
+            bpy.ops.mesh.primitive_cylinder_add(radius=size, depth=size * 2)
         elif shape == "Cone":
-            bpy.ops.mesh.primitive_cone_add(radius1=size, depth=size * 2, location=location)
+            bpy.ops.mesh.primitive_cone_add(radius1=size, depth=size * 2)
         elif shape == "Torus":
-            bpy.ops.mesh.primitive_torus_add(major_radius=size, minor_radius=size * 0.3, location=location)
+            bpy.ops.mesh.primitive_torus_add(major_radius=size, minor_radius=size * 0.3)
         elif shape == "Plane":
-            bpy.ops.mesh.primitive_plane_add(size=size * 2, location=location)
+            bpy.ops.mesh.primitive_plane_add(size=size * 2)
         else:
             raise ValueError(f"Unknown shape: {shape}")
-            
-        obj = bpy.context.active_object
-        obj.name = name
         
-        return {"object": obj.name, "type": shape}
+        # Keep the mesh, drop the object the operator created
+        obj = bpy.context.active_object
+        mesh = obj.data
+        mesh.name = template_name
+        bpy.data.objects.remove(obj)
+        return mesh
     
     def _tool_extrude_faces(self, args: dict) -> dict:
         """Extrude selected faces."""
@@ -165,27 +629,26 @@ class BlenderMCPServer:
         depth = args["depth"]
         select_all = args.get("select_all", False)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
-        # Set active and select
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="FACE")
-        
-        if select_all:
-            bpy.ops.mesh.select_all(action="SELECT")
+        with self._bmesh(obj) as bm:
+            faces = bm.faces[:] if select_all else [f for f in bm.faces if f.select]
             
-        # Extrude
-        bpy.ops.mesh.extrude_region_move(
-            TRANSFORM_OT_translate={"value": (0, 0, depth)}
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+            # Extrude, then move the new region along global Z
+            ret = bmesh.ops.extrude_face_region(bm, geom=faces)
+            verts = [v for v in ret["geom"] if isinstance(v, bmesh.types.BMVert)]
+            bmesh.ops.translate(bm, verts=verts, vec=(0, 0, depth), space=obj.matrix_world)
+            
+            # Leave the extruded cap selected, as mesh.extrude_region_move did,
+            # so a chained extrude/inset/bevel acts on it
+            for elements in (bm.verts, bm.edges, bm.faces):
+                for element in elements:
+                    element.select = False
+            for element in ret["geom"]:
+                element.select_set(True)
+            bm.select_flush(True)
         
         return {"object": obj_name, "extruded_depth": depth}
     
@@ -195,17 +658,13 @@ class BlenderMCPServer:
         thickness = args["thickness"]
         depth = args.get("depth", 0)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="FACE")
-        
-        bpy.ops.mesh.inset(thickness=thickness, depth=depth)
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._bmesh(obj) as bm:
+            faces = [f for f in bm.faces if f.select]
+            bmesh.ops.inset_region(bm, faces=faces, thickness=thickness, depth=depth)
         
         return {"object": obj_name, "inset_thickness": thickness}
     
@@ -215,18 +674,11 @@ class BlenderMCPServer:
         width = args["width"]
         segments = args.get("segments", 1)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="EDGE")
-        bpy.ops.mesh.select_all(action="SELECT")
-        
-        bpy.ops.mesh.bevel(offset=width, segments=segments)
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        self._bevel(obj, [], offset=width, segments=segments, profile=0.5)
         
         return {"object": obj_name, "bevel_width": width}
     
@@ -236,18 +688,14 @@ class BlenderMCPServer:
         cuts = args.get("cuts", 1)
         edge_index = args.get("edge_index", 0)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        
-        bpy.ops.mesh.loopcut_slide(
-            MESH_OT_loopcut={"number_cuts": cuts, "edge_index": edge_index}
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            bpy.ops.mesh.loopcut_slide(
+                MESH_OT_loopcut={"number_cuts": cuts, "edge_index": edge_index}
+            )
         
         return {"object": obj_name, "cuts": cuts}
     
@@ -257,7 +705,7 @@ class BlenderMCPServer:
         mod_type = args["modifier_type"]
         params = args.get("params", {})
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
@@ -286,7 +734,7 @@ class BlenderMCPServer:
         elif mod_type == "SOLIDIFY":
             mod.thickness = params.get("thickness", 0.1)
         elif mod_type == "BOOLEAN":
-            other_obj = bpy.data.objects.get(params.get("object", ""))
+            other_obj = _get_object(params.get("object", ""))
             if other_obj:
                 mod.object = other_obj
                 mod.operation = params.get("operation", "DIFFERENCE")
@@ -298,7 +746,7 @@ class BlenderMCPServer:
         obj_name = args["object_name"]
         mod_name = args["modifier_name"]
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
@@ -314,42 +762,33 @@ class BlenderMCPServer:
         action = args["action"]
         indices = args.get("indices", [])
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type=mode)
-        
-        if action == "SELECT_ALL":
-            bpy.ops.mesh.select_all(action="SELECT")
-        elif action == "DESELECT_ALL":
-            bpy.ops.mesh.select_all(action="DESELECT")
-        elif action == "INVERT":
-            bpy.ops.mesh.select_all(action="INVERT")
-        elif action == "SELECT_INDICES":
-            # Need to access mesh data directly
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT")
-            
-            mesh = obj.data
-            if mode == "VERT":
-                for i in indices:
-                    if i < len(mesh.vertices):
-                        mesh.vertices[i].select = True
-            elif mode == "EDGE":
-                for i in indices:
-                    if i < len(mesh.edges):
-                        mesh.edges[i].select = True
-            elif mode == "FACE":
-                for i in indices:
-                    if i < len(mesh.polygons):
-                        mesh.polygons[i].select = True
-                        
-            bpy.ops.object.mode_set(mode="EDIT")
-            
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            bpy.ops.mesh.select_mode(type=mode)
+
+            if action == "SELECT_ALL":
+                bpy.ops.mesh.select_all(action="SELECT")
+            elif action == "DESELECT_ALL":
+                bpy.ops.mesh.select_all(action="DESELECT")
+            elif action == "INVERT":
+                bpy.ops.mesh.select_all(action="INVERT")
+            elif action == "SELECT_INDICES":
+                # Need to access mesh data directly
+                bpy.ops.mesh.select_all(action="DESELECT")
+                bpy.ops.object.mode_set(mode="OBJECT")
+
+                mesh = obj.data
+                if mode == "VERT":
+                    _select_indices(mesh.vertices, indices)
+                elif mode == "EDGE":
+                    _select_indices(mesh.edges, indices)
+                elif mode == "FACE":
+                    _select_indices(mesh.polygons, indices)
+
+                bpy.ops.object.mode_set(mode="EDIT")
         
         return {"object": obj_name, "selection_mode": mode, "action": action}
     
@@ -357,7 +796,7 @@ class BlenderMCPServer:
         """Transform an object."""
         obj_name = args["object_name"]
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
@@ -376,11 +815,40 @@ class BlenderMCPServer:
             
         return {"object": obj_name, "transformed": True}
     
+    def _tool_transform_objects(self, args: dict) -> dict:
+        """Transform many objects in one call."""
+        names = args["object_names"]
+        
+        objects = []
+        for name in names:
+            obj = _get_object(name)
+            if not obj:
+                raise ValueError(f"Object not found: {name}")
+            objects.append(obj)
+        
+        for key in ("locations", "rotations", "scales"):
+            if key in args and len(args[key]) != len(names):
+                raise ValueError(f"{key} has {len(args[key])} entries for {len(names)} objects")
+        
+        if "locations" in args:
+            for obj, loc in zip(objects, args["locations"]):
+                obj.location = loc
+        if "rotations" in args:
+            # Convert degrees to radians for all objects at once
+            rotations = np.radians(np.asarray(args["rotations"], dtype=np.float64))
+            for obj, rot in zip(objects, rotations):
+                obj.rotation_euler = rot
+        if "scales" in args:
+            for obj, scale in zip(objects, args["scales"]):
+                obj.scale = scale
+        
+        return {"objects": names, "transformed": len(objects)}
+    
     def _tool_delete_object(self, args: dict) -> dict:
         """Delete an object."""
         obj_name = args["object_name"]
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
             
@@ -409,8 +877,59 @@ class BlenderMCPServer:
         width = args.get("width", 800)
         height = args.get("height", 600)
         
+        self._apply_deferred()
+        space, region = _find_view3d()
+        if space is not None:
+            image_data = self._draw_offscreen(space, region, width, height)
+        else:
+            image_data = self._render_opengl(width, height)
+        
+        # Sent raw after the JSON response
+        return {
+            "image_format": "png",
+            "width": width,
+            "height": height,
+            "size": len(image_data),
+            "_binary": image_data,
+        }
+    
+    def _draw_offscreen(self, space, region, width: int, height: int) -> bytes:
+        """Draw the viewport into a cached GPU offscreen buffer and PNG-encode it."""
+        key = (width, height)
+        cached = self._offscreen_cache.get(key)
+        if cached is None:
+            cached = (
+                gpu.types.GPUOffScreen(width, height),
+                gpu.types.Buffer("UBYTE", width * height * 4),
+            )
+            self._offscreen_cache[key] = cached
+        offscreen, pixels = cached
+        
+        # Keep the viewport's vertical field of view at the requested aspect
+        rv3d = space.region_3d
+        projection = rv3d.window_matrix.copy()
+        projection[0][0] *= (region.width / region.height) / (width / height)
+        
+        context = bpy.context
+        offscreen.draw_view3d(
+            context.scene,
+            context.view_layer,
+            space,
+            region,
+            rv3d.view_matrix,
+            projection,
+            do_color_management=True,
+        )
+        with offscreen.bind():
+            fb = gpu.state.active_framebuffer_get()
+            fb.read_color(0, 0, width, height, 4, 0, "UBYTE", data=pixels)
+        
+        return _encode_png(np.asarray(pixels, dtype=np.uint8), width, height)
+    
+    def _render_opengl(self, width: int, height: int) -> bytes:
+        """Render through the OpenGL render operator (no 3D viewport available)."""
         # Create temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False, dir=SCREENSHOT_DIR) as f:
             filepath = f.name
             
         # Set render settings
@@ -431,13 +950,10 @@ class BlenderMCPServer:
         scene.render.resolution_y = old_res_y
         scene.render.filepath = old_filepath
         
-        # Read and encode image
-        with open(filepath, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-            
-        Path(filepath).unlink()
-        
-        return {"image_base64": image_data, "width": width, "height": height}
+        path = Path(filepath)
+        image_data = path.read_bytes()
+        path.unlink()
+        return image_data
     
     def _tool_execute_code(self, args: dict) -> dict:
         """Execute arbitrary Python code."""
@@ -446,7 +962,7 @@ class BlenderMCPServer:
         exec_globals = {"bpy": bpy}
         exec_locals = {}
         
-        exec(code, exec_globals, exec_locals)
+        exec(_compile_cached(code), exec_globals, exec_locals)
         
         return {"executed": True}
     
@@ -458,36 +974,33 @@ class BlenderMCPServer:
         axis = args.get("axis", "Z")
         center = tuple(args.get("center", [0, 0, 0]))
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
         
         # Set active and enter edit mode
-        bpy.context.view_layer.objects.active = obj
         obj.select_set(True)
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        
-        # Convert angle to radians (Blender spin uses radians)
-        angle_rad = math.radians(angle_deg)
-        
-        # Set axis tuple
-        if axis == "X":
-            axis_vec = (1, 0, 0)
-        elif axis == "Y":
-            axis_vec = (0, 1, 0)
-        else:  # Z
-            axis_vec = (0, 0, 1)
-        
-        # Perform spin operation
-        bpy.ops.mesh.spin(
-            steps=steps,
-            angle=angle_rad,
-            center=center,
-            axis=axis_vec
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            bpy.ops.mesh.select_all(action="SELECT")
+
+            # Convert angle to radians (Blender spin uses radians)
+            angle_rad = math.radians(angle_deg)
+
+            # Set axis tuple
+            if axis == "X":
+                axis_vec = (1, 0, 0)
+            elif axis == "Y":
+                axis_vec = (0, 1, 0)
+            else:  # Z
+                axis_vec = (0, 0, 1)
+
+            # Perform spin operation
+            bpy.ops.mesh.spin(
+                steps=steps,
+                angle=angle_rad,
+                center=center,
+                axis=axis_vec
+            )
         
         return {
             "object": obj_name,
@@ -505,7 +1018,7 @@ class BlenderMCPServer:
         steps = args.get("steps", 16)
         axis = args.get("axis", "Z")
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
         
@@ -540,24 +1053,19 @@ class BlenderMCPServer:
         
         # Calculate points for spiral
         total_steps = int(turns * steps)
-        points = []
+        t = np.linspace(0.0, 1.0, total_steps + 1)
+        angle = t * turns * 2 * math.pi
         
-        for i in range(total_steps + 1):
-            t = i / total_steps  # 0 to 1
-            angle = t * turns * 2 * math.pi
-            
-            # Apply direction
-            if direction == "CLOCKWISE":
-                angle = -angle
-            
-            # Interpolate radius
-            radius = radius_start + (radius_end - radius_start) * t
-            
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            z = t * height
-            
-            points.append((x, y, z))
+        # Apply direction
+        if direction == "CLOCKWISE":
+            angle = -angle
+        
+        # Interpolate radius
+        radius = radius_start + (radius_end - radius_start) * t
+        
+        # (x, y, z, w) per point; w=1 for NURBS weight
+        co = np.column_stack((radius * np.cos(angle), radius * np.sin(angle),
+                              t * height, np.ones_like(t)))
         
         # Create curve data
         curve_data = bpy.data.curves.new(name="Spiral", type="CURVE")
@@ -565,10 +1073,8 @@ class BlenderMCPServer:
         
         # Create spline
         spline = curve_data.splines.new(type="POLY")
-        spline.points.add(len(points) - 1)  # -1 because one point exists by default
-        
-        for i, (x, y, z) in enumerate(points):
-            spline.points[i].co = (x, y, z, 1)  # w=1 for NURBS weight
+        spline.points.add(len(co) - 1)  # -1 because one point exists by default
+        spline.points.foreach_set("co", co.astype(np.float32).ravel())
         
         # Create object
         curve_obj = bpy.data.objects.new("Spiral", curve_data)
@@ -582,7 +1088,7 @@ class BlenderMCPServer:
             "height": height,
             "radius_start": radius_start,
             "radius_end": radius_end,
-            "points": len(points),
+            "points": len(co),
         }
     
     def _tool_curve_to_mesh(self, args: dict) -> dict:
@@ -591,7 +1097,7 @@ class BlenderMCPServer:
         bevel_depth = args.get("bevel_depth", 0)
         bevel_resolution = args.get("bevel_resolution", 4)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
         
@@ -626,28 +1132,24 @@ class BlenderMCPServer:
         obj_name = args["object_name"]
         sides = args.get("sides", 0)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
         obj.select_set(True)
-        bpy.ops.object.mode_set(mode="EDIT")
-        
-        # Select boundary edges
-        bpy.ops.mesh.select_mode(type="EDGE")
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.mesh.select_non_manifold(extend=False, use_wire=False, 
-                                          use_boundary=True, use_multi_face=False,
-                                          use_non_contiguous=False, use_verts=False)
-        
-        # Fill holes
-        if sides > 0:
-            bpy.ops.mesh.fill_holes(sides=sides)
-        else:
-            bpy.ops.mesh.fill_holes()
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            # Select boundary edges
+            bpy.ops.mesh.select_mode(type="EDGE")
+            bpy.ops.mesh.select_all(action="DESELECT")
+            bpy.ops.mesh.select_non_manifold(extend=False, use_wire=False, 
+                                              use_boundary=True, use_multi_face=False,
+                                              use_non_contiguous=False, use_verts=False)
+
+            # Fill holes
+            if sides > 0:
+                bpy.ops.mesh.fill_holes(sides=sides)
+            else:
+                bpy.ops.mesh.fill_holes()
         
         return {
             "object": obj_name,
@@ -661,26 +1163,18 @@ class BlenderMCPServer:
         edge_indices_2 = args["edge_indices_2"]
         segments = args.get("segments", 1)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="EDGE")
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.object.mode_set(mode="OBJECT")
-        
-        # Select edge indices
-        mesh = obj.data
-        all_indices = edge_indices_1 + edge_indices_2
-        for i in all_indices:
-            if i < len(mesh.edges):
-                mesh.edges[i].select = True
+        # Select edge indices in object mode so edit mode is entered once
+        if obj.mode == "EDIT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        _select_only_edges(obj.data, edge_indices_1 + edge_indices_2)
         
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.bridge_edge_loops(number_cuts=segments)
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            bpy.ops.mesh.select_mode(type="EDGE")
+            bpy.ops.mesh.bridge_edge_loops(number_cuts=segments)
         
         return {
             "object": obj_name,
@@ -694,21 +1188,21 @@ class BlenderMCPServer:
         cuts = args.get("cuts", 1)
         smoothness = args.get("smoothness", 0)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        bpy.ops.mesh.subdivide(number_cuts=cuts, smoothness=smoothness)
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._bmesh(obj) as bm:
+            bmesh.ops.subdivide_edges(
+                bm, edges=bm.edges[:], cuts=cuts, smooth=smoothness, use_grid_fill=True
+            )
+            num_verts, num_faces = len(bm.verts), len(bm.faces)
         
         return {
             "object": obj_name,
             "cuts": cuts,
-            "vertices": len(obj.data.vertices),
-            "faces": len(obj.data.polygons),
+            "vertices": num_verts,
+            "faces": num_faces,
         }
     
     def _tool_merge_vertices(self, args: dict) -> dict:
@@ -717,29 +1211,31 @@ class BlenderMCPServer:
         merge_type = args.get("merge_type", "BY_DISTANCE")
         threshold = args.get("threshold", 0.0001)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        
         if merge_type == "BY_DISTANCE":
-            bpy.ops.mesh.remove_doubles(threshold=threshold)
-        elif merge_type == "CENTER":
-            bpy.ops.mesh.merge(type="CENTER")
-        elif merge_type == "AT_FIRST":
-            bpy.ops.mesh.merge(type="FIRST")
-        elif merge_type == "AT_LAST":
-            bpy.ops.mesh.merge(type="LAST")
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+            with self._bmesh(obj) as bm:
+                bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=threshold)
+                num_verts = len(bm.verts)
+        else:
+            with self._edit(obj):
+                bpy.ops.mesh.select_all(action="SELECT")
+
+                if merge_type == "CENTER":
+                    bpy.ops.mesh.merge(type="CENTER")
+                elif merge_type == "AT_FIRST":
+                    bpy.ops.mesh.merge(type="FIRST")
+                elif merge_type == "AT_LAST":
+                    bpy.ops.mesh.merge(type="LAST")
+                obj.update_from_editmode()
+            num_verts = len(obj.data.vertices)
         
         return {
             "object": obj_name,
             "merge_type": merge_type,
-            "vertices": len(obj.data.vertices),
+            "vertices": num_verts,
         }
     
     def _tool_export_stl(self, args: dict) -> dict:
@@ -749,34 +1245,40 @@ class BlenderMCPServer:
         ascii_format = args.get("ascii", False)
         apply_modifiers = args.get("apply_modifiers", True)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
         
-        # Deselect all, select target
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+        if obj.mode == "EDIT":
+            obj.update_from_editmode()
+        self._apply_deferred()
         
-        # Export - try new Blender 5.0/4.2+ API first, fallback to legacy
-        try:
-            # Blender 5.0+ uses wm.stl_export
-            bpy.ops.wm.stl_export(
-                filepath=file_path,
-                export_selected_objects=True,
-                ascii_format=ascii_format,
-                apply_modifiers=apply_modifiers,
-            )
-        except AttributeError:
-            # Fallback for Blender 4.1 and earlier
-            bpy.ops.export_mesh.stl(
-                filepath=file_path,
-                use_selection=True,
-                ascii=ascii_format,
-                use_mesh_modifiers=apply_modifiers,
-            )
+        if not ascii_format:
+            _write_binary_stl(obj, file_path, apply_modifiers)
+        else:
+            # Deselect all, select target
+            bpy.ops.object.select_all(action="DESELECT")
+            obj.select_set(True)
+            bpy.context.view_layer.objects.active = obj
+            
+            # Export - try new Blender 5.0/4.2+ API first, fallback to legacy
+            try:
+                # Blender 5.0+ uses wm.stl_export
+                bpy.ops.wm.stl_export(
+                    filepath=file_path,
+                    export_selected_objects=True,
+                    ascii_format=ascii_format,
+                    apply_modifiers=apply_modifiers,
+                )
+            except AttributeError:
+                # Fallback for Blender 4.1 and earlier
+                bpy.ops.export_mesh.stl(
+                    filepath=file_path,
+                    use_selection=True,
+                    ascii=ascii_format,
+                    use_mesh_modifiers=apply_modifiers,
+                )
         
-        import os
         file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
         
         return {
@@ -790,11 +1292,20 @@ class BlenderMCPServer:
         """Get mesh statistics for validation."""
         obj_name = args["object_name"]
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
+        # Check for non-manifold geometry
+        with self._edit(obj):
+            bpy.ops.mesh.select_all(action="DESELECT")
+            bpy.ops.mesh.select_non_manifold()
+            # Flush the edit mesh so counts are current inside a batch
+            obj.update_from_editmode()
+
         mesh = obj.data
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
         
         # Basic stats
         stats = {
@@ -802,25 +1313,19 @@ class BlenderMCPServer:
             "vertices": len(mesh.vertices),
             "edges": len(mesh.edges),
             "faces": len(mesh.polygons),
-            "triangles": sum(len(p.vertices) - 2 for p in mesh.polygons),
+            "triangles": int(loop_totals.sum()) - 2 * len(loop_totals),
         }
         
-        # Check for non-manifold geometry
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.mesh.select_non_manifold()
-        
         # Count non-manifold elements
-        bpy.ops.object.mode_set(mode="OBJECT")
-        non_manifold_verts = sum(1 for v in mesh.vertices if v.select)
+        selected = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get("select", selected)
+        non_manifold_verts = int(np.count_nonzero(selected))
         
         stats["non_manifold_vertices"] = non_manifold_verts
         stats["is_manifold"] = non_manifold_verts == 0
         stats["is_watertight"] = non_manifold_verts == 0
         
         # Bounding box
-        bbox = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
         dimensions = obj.dimensions
         stats["dimensions"] = [round(d, 4) for d in dimensions]
         
@@ -833,41 +1338,37 @@ class BlenderMCPServer:
         cut_end = args["cut_end"]
         cut_through = args.get("cut_through", True)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-        
-        # Use bisect as a programmatic knife alternative
-        plane_co = ((cut_start[0] + cut_end[0])/2, 
-                    (cut_start[1] + cut_end[1])/2, 
-                    (cut_start[2] + cut_end[2])/2)
-        
-        # Calculate plane normal from cut direction
-        import mathutils
-        start_v = mathutils.Vector(cut_start)
-        end_v = mathutils.Vector(cut_end)
-        cut_dir = (end_v - start_v).normalized()
-        
-        # Use perpendicular as normal
-        if abs(cut_dir.z) < 0.9:
-            plane_no = cut_dir.cross(mathutils.Vector((0, 0, 1)))
-        else:
-            plane_no = cut_dir.cross(mathutils.Vector((1, 0, 0)))
-        plane_no.normalize()
-        
-        bpy.ops.mesh.bisect(
-            plane_co=plane_co,
-            plane_no=tuple(plane_no),
-            use_fill=False,
-            clear_inner=False,
-            clear_outer=False,
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with self._edit(obj):
+            bpy.ops.mesh.select_all(action="SELECT")
+
+            # Use bisect as a programmatic knife alternative
+            plane_co = ((cut_start[0] + cut_end[0])/2, 
+                        (cut_start[1] + cut_end[1])/2, 
+                        (cut_start[2] + cut_end[2])/2)
+
+            # Calculate plane normal from cut direction
+            start_v = mathutils.Vector(cut_start)
+            end_v = mathutils.Vector(cut_end)
+            cut_dir = (end_v - start_v).normalized()
+
+            # Use perpendicular as normal
+            if abs(cut_dir.z) < 0.9:
+                plane_no = cut_dir.cross(mathutils.Vector((0, 0, 1)))
+            else:
+                plane_no = cut_dir.cross(mathutils.Vector((1, 0, 0)))
+            plane_no.normalize()
+
+            bpy.ops.mesh.bisect(
+                plane_co=plane_co,
+                plane_no=tuple(plane_no),
+                use_fill=False,
+                clear_inner=False,
+                clear_outer=False,
+            )
         
         return {
             "object": obj_name,
@@ -883,27 +1384,14 @@ class BlenderMCPServer:
         metallic = args.get("metallic", 0)
         roughness = args.get("roughness", 0.5)
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj:
             raise ValueError(f"Object not found: {obj_name}")
         
-        # Create or get material
-        mat = bpy.data.materials.get(mat_name)
-        if not mat:
-            mat = bpy.data.materials.new(name=mat_name)
-        
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get("Principled BSDF")
-        if bsdf:
-            bsdf.inputs["Base Color"].default_value = (*color, 1.0)
-            bsdf.inputs["Metallic"].default_value = metallic
-            bsdf.inputs["Roughness"].default_value = roughness
+        _COLOR_BUF[:3] = color
+        mat = self._material(mat_name, _COLOR_BUF, metallic, roughness)
         
-        # Assign to object
-        if obj.data.materials:
-            obj.data.materials[0] = mat
-        else:
-            obj.data.materials.append(mat)
+        _set_first_material(obj, mat)
         
         return {
             "object": obj_name,
@@ -911,6 +1399,71 @@ class BlenderMCPServer:
             "color": color,
         }
     
+    def _tool_assign_materials(self, args: dict) -> dict:
+        """Create and assign materials to many objects; each distinct spec is built once."""
+        assignments = args["assignments"]
+        
+        objects = []
+        for item in assignments:
+            obj = _get_object(item["object_name"])
+            if not obj:
+                raise ValueError(f"Object not found: {item['object_name']}")
+            objects.append(obj)
+        
+        # Deduplicate material specs, then pack them as (N, 4) RGBA rows
+        specs = {}
+        keys = []
+        for item in assignments:
+            key = (
+                item["material_name"],
+                tuple(item.get("color", [0.8, 0.8, 0.8])),
+                float(item.get("metallic", 0)),
+                float(item.get("roughness", 0.5)),
+            )
+            specs.setdefault(key, len(specs))
+            keys.append(key)
+        colors = np.ones((len(specs), 4), dtype=np.float32)
+        colors[:, :3] = [key[1] for key in specs]
+        materials = [
+            self._material(name, colors[i], metallic, roughness)
+            for (name, _, metallic, roughness), i in specs.items()
+        ]
+        
+        for obj, key in zip(objects, keys):
+            _set_first_material(obj, materials[specs[key]])
+        
+        return {
+            "assigned": len(objects),
+            "materials": len(materials),
+        }
+    
+    def _material(self, mat_name: str, rgba, metallic: float, roughness: float):
+        """Get or create a material and set its Principled BSDF values."""
+        mat = _get_material(mat_name)
+        if not mat:
+            mat = bpy.data.materials.new(name=mat_name)
+            # Seed the lookup cache so the next call skips bpy.data entirely
+            _MATERIAL_CACHE[mat.name] = mat
+        
+        if not mat.use_nodes:
+            mat.use_nodes = True
+        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        if bsdf:
+            inputs = bsdf.inputs
+            base = inputs["Base Color"]
+            metal = inputs["Metallic"]
+            rough = inputs["Roughness"]
+            # Compare against the live socket values (stored as float32), so
+            # undo, file loads and edits in the UI never leave a stale skip;
+            # an unchanged material gets no writes and no shader update
+            if tuple(base.default_value) != tuple(rgba.tolist()):
+                base.default_value = rgba
+            if metal.default_value != np.float32(metallic):
+                metal.default_value = metallic
+            if rough.default_value != np.float32(roughness):
+                rough.default_value = roughness
+        return mat
+    
     def _tool_fillet_edges(self, args: dict) -> dict:
         """Apply rounded fillet to edges using bevel with high profile."""
         obj_name = args["object_name"]
@@ -918,37 +1471,12 @@ class BlenderMCPServer:
         segments = args.get("segments", 4)
         edge_indices = args.get("edge_indices", [])
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="EDGE")
-        
-        if edge_indices:
-            # Select specific edges
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT")
-            mesh = obj.data
-            for i in edge_indices:
-                if i < len(mesh.edges):
-                    mesh.edges[i].select = True
-            bpy.ops.object.mode_set(mode="EDIT")
-        else:
-            # Select all edges
-            bpy.ops.mesh.select_all(action="SELECT")
-        
-        # Apply fillet using bevel with profile=1.0 (rounded)
-        bpy.ops.mesh.bevel(
-            offset=radius,
-            offset_type="OFFSET",
-            segments=segments,
-            profile=1.0,  # Rounded fillet profile
-            affect="EDGES"
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        # Fillet is a bevel with profile=1.0 (rounded)
+        self._bevel(obj, edge_indices, offset=radius, segments=segments, profile=1.0)
         
         return {
             "object": obj_name,
@@ -963,43 +1491,60 @@ class BlenderMCPServer:
         size = args["size"]
         edge_indices = args.get("edge_indices", [])
         
-        obj = bpy.data.objects.get(obj_name)
+        obj = _get_object(obj_name)
         if not obj or obj.type != "MESH":
             raise ValueError(f"Mesh object not found: {obj_name}")
         
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_mode(type="EDGE")
-        
-        if edge_indices:
-            # Select specific edges
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT")
-            mesh = obj.data
-            for i in edge_indices:
-                if i < len(mesh.edges):
-                    mesh.edges[i].select = True
-            bpy.ops.object.mode_set(mode="EDIT")
-        else:
-            # Select all edges
-            bpy.ops.mesh.select_all(action="SELECT")
-        
-        # Apply chamfer using bevel with profile=0.5 (flat/linear)
-        bpy.ops.mesh.bevel(
-            offset=size,
-            offset_type="OFFSET",
-            segments=1,  # Single segment for flat chamfer
-            profile=0.5,  # Linear profile for chamfer
-            affect="EDGES"
-        )
-        
-        bpy.ops.object.mode_set(mode="OBJECT")
+        # Chamfer is a single-segment bevel with profile=0.5 (flat/linear)
+        self._bevel(obj, edge_indices, offset=size, segments=1, profile=0.5)
         
         return {
             "object": obj_name,
             "size": size,
             "edges_chamfered": len(edge_indices) if edge_indices else "all",
         }
+    
+    def _tool_bevel_batch(self, args: dict) -> dict:
+        """Bevel edges on many objects, one bevel operator call per parameter set."""
+        groups = {}
+        for item in args["bevels"]:
+            obj_name = item["object_name"]
+            obj = _get_object(obj_name)
+            if not obj or obj.type != "MESH":
+                raise ValueError(f"Mesh object not found: {obj_name}")
+            key = (item["radius"], item.get("segments", 4), item.get("profile", 1.0))
+            groups.setdefault(key, []).append((obj, item.get("edge_indices", [])))
+        
+        if bpy.context.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        
+        for (radius, segments, profile), targets in groups.items():
+            # Selection masks are written in object mode, then every object
+            # in the group is bevelled by one multi-object edit session
+            bpy.ops.object.select_all(action="DESELECT")
+            for obj, edge_indices in targets:
+                mesh = obj.data
+                _select_only_edges(mesh, edge_indices or range(len(mesh.edges)))
+                obj.select_set(True)
+            bpy.context.view_layer.objects.active = targets[0][0]
+            
+            bpy.ops.object.mode_set(mode="EDIT")
+            bpy.ops.mesh.select_mode(type="EDGE")
+            bpy.ops.mesh.bevel(
+                offset=radius,
+                offset_type="OFFSET",
+                segments=segments,
+                profile=profile,
+                affect="EDGES",
+                clamp_overlap=True,
+                loop_slide=True,
+            )
+            bpy.ops.object.mode_set(mode="OBJECT")
+        
+        return {
+            "objects": [item["object_name"] for item in args["bevels"]],
+            "operator_calls": len(groups),
+        }
 
 
 # ===== Blender Addon Registration =====
@@ -1033,8 +1578,11 @@ class MCP_OT_StartServer(bpy.types.Operator):
         global _server, _server_thread
         
         if _server is None:
-            _server = BlenderMCPServer()
-            _server.start()
+            # Only publish the server once it is bound, so a failed start
+            # (port in use) can be retried
+            server = BlenderMCPServer()
+            server.start()
+            _server = server
             _server_thread = threading.Thread(target=_server.serve, daemon=True)
             _server_thread.start()
             
@@ -1064,18 +1612,37 @@ classes = [
 ]
 
 
+def _auto_start():
+    """Start the server from a timer, retrying every 2 s while the port is busy."""
+    try:
+        if _server is None:
+            bpy.ops.mcp.start_server()
+    except Exception as e:
+        print(f"Blender MCP Server auto-start failed, retrying: {e}")
+        return 2.0
+    return None
+
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    for handlers, handler in _CACHE_RESET_HANDLERS:
+        handlers.append(handler)
     # Auto-start server
-    bpy.app.timers.register(lambda: bpy.ops.mcp.start_server() or None, first_interval=1.0)
+    bpy.app.timers.register(_auto_start, first_interval=1.0)
 
 
 def unregister():
     global _server
+    if bpy.app.timers.is_registered(_auto_start):
+        bpy.app.timers.unregister(_auto_start)
     if _server:
         _server.stop()
         _server = None
+    for handlers, handler in _CACHE_RESET_HANDLERS:
+        if handler in handlers:
+            handlers.remove(handler)
+    _clear_id_caches()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -1,3 +1,3 @@
 """Blender MCP Server - AI-assisted 3D mesh modeling."""
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
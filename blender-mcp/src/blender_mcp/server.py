@@ -4,46 +4,231 @@ This server provides tools for AI-assisted 3D mesh modeling in Blender.
 Communication with Blender happens via TCP sockets to the Blender addon.
 """
 
+import asyncio
+import base64
+import functools
 import json
 import os
 import socket
+from pathlib import Path
 from typing import Any
 
+import jsonschema
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool, TextContent, ImageContent
+
+# orjson encodes to and parses from bytes directly and is several times
+# faster than stdlib json; the latter is the fallback.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# uvloop (libuv) replaces asyncio's selector loop and transports where it
+# is installed (not on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 # Configuration
 BLENDER_HOST = os.environ.get("BLENDER_HOST", "localhost")
 BLENDER_PORT = int(os.environ.get("BLENDER_PORT", "9876"))
 
+# Wire format shared with the addon (>= 0.2.0): 4-byte little-endian
+# length prefix, then that many bytes of JSON. A response carrying
+# "binary_size" is followed by one raw frame of that many bytes. The
+# connection stays open across requests.
+HEADER_SIZE = 4
+# Above the addon's own 30 s limit, so its timeout reply arrives first
+TIMEOUT = 60.0
+
+
+class _BlenderConnection:
+    """A persistent connection to the Blender addon, shared by all tool calls."""
+    
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+        # One request/response exchange on the wire at a time
+        self._lock = asyncio.Lock()
+        
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        sock = self._writer.get_extra_info("socket")
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        
+    async def _read_frame(self) -> bytes:
+        size = int.from_bytes(await self._reader.readexactly(HEADER_SIZE), "little")
+        return await self._reader.readexactly(size)
+        
+    async def _send(self, message: bytes):
+        self._writer.writelines((len(message).to_bytes(HEADER_SIZE, "little"), message))
+        await self._writer.drain()
+        
+    async def _receive(self) -> dict:
+        frame = await self._read_frame()
+        response = _json_loads(frame)
+        # Kept so call_tool can forward the addon's JSON without re-encoding it
+        response["raw"] = frame
+        if "binary_size" in response:
+            response["binary"] = await self._read_frame()
+        return response
+        
+    async def request(self, message: bytes, timeout: float = TIMEOUT) -> dict:
+        """Send one encoded command and return the decoded response."""
+        async with self._lock:
+            # A connection Blender closed while it sat idle (e.g. Blender was
+            # restarted) has already seen EOF; replace it before sending
+            if self._writer is not None and (self._reader.at_eof() or self._writer.is_closing()):
+                self._close()
+            reconnected = self._writer is None
+            if reconnected:
+                await self._connect()
+            try:
+                try:
+                    await asyncio.wait_for(self._send(message), timeout)
+                except ConnectionError:
+                    # Only a failed send is retried: once the command is out,
+                    # Blender may already have run it
+                    self._close()
+                    if reconnected:
+                        raise
+                    await self._connect()
+                    await asyncio.wait_for(self._send(message), timeout)
+                return await asyncio.wait_for(self._receive(), timeout)
+            except BaseException:
+                # Timeout or cancellation mid-exchange: the stream is out of sync
+                self._close()
+                raise
+
+
+_connection = _BlenderConnection(BLENDER_HOST, BLENDER_PORT)
+
+
+@functools.lru_cache(maxsize=None)
+def _command_prefix(name: str) -> bytes:
+    """The constant b'{"tool":<name>,"arguments":' head of a command."""
+    return b'{"tool":' + _json_dumps(name) + b',"arguments":'
+
 
-def send_to_blender(command: dict) -> dict:
-    """Send a command to Blender via socket and return response."""
+def _encode_command(name: str, arguments: dict) -> bytes:
+    # Only the arguments need encoding per call
+    return _command_prefix(name) + _json_dumps(arguments) + b"}"
+
+# Tool calls issued concurrently (e.g. parallel calls from the client) are
+# queued and sent together as one "batch" command on the next loop tick.
+# The batch is "isolated": the addon runs each call exactly as if it came
+# alone (own edit-mode session, no held-back mesh updates) and gives each
+# one its own time limit. Replies with a binary frame cannot ride in a
+# batch, and the deferral tools and explicit batches would interfere with
+# the combined batch, so those go out alone, in their place in the queue.
+_UNBATCHABLE = {"get_screenshot", "begin_batch", "end_batch", "batch"}
+# Longest run of calls combined into one batch, so a single slow call
+# holds up at most this many others
+MAX_BATCH = 8
+# (encoded command, future, batchable, timeout)
+_pending: list[tuple[bytes, asyncio.Future, bool, float]] = []
+_flush_task = None
+# Flushes run one after another so later calls never overtake earlier ones
+_flush_lock = asyncio.Lock()
+
+
+async def _send_run(run: list[tuple[bytes, asyncio.Future, bool, float]]):
+    """Send a run of queued commands, alone or as one batch, and resolve their futures."""
+    try:
+        if len(run) == 1:
+            results = [await _connection.request(run[0][0], run[0][3])]
+        else:
+            response = await _connection.request(
+                _command_prefix("batch")
+                + b'{"isolated":true,"commands":['
+                + b",".join(item[0] for item in run) + b"]}}",
+                TIMEOUT * len(run),
+            )
+            if not response.get("success"):
+                results = [response] * len(run)
+            else:
+                results = response["result"]["results"]
+    except Exception as e:
+        for _, future, _, _ in run:
+            if not future.done():
+                future.set_exception(e)
+        return
+    for (_, future, _, _), result in zip(run, results):
+        if not future.done():
+            future.set_result(result)
+
+
+async def _flush():
+    global _flush_task
+    async with _flush_lock:
+        queued = _pending[:]
+        _pending.clear()
+        _flush_task = None
+        run = []
+        try:
+            for item in queued:
+                if item[2]:
+                    run.append(item)
+                    if len(run) == MAX_BATCH:
+                        await _send_run(run)
+                        run = []
+                    continue
+                if run:
+                    await _send_run(run)
+                    run = []
+                await _send_run([item])
+            if run:
+                await _send_run(run)
+        except BaseException as e:
+            # Cancelled mid-flush: fail whatever is still waiting
+            for _, future, _, _ in queued:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+
+async def _submit(name: str, arguments: dict) -> dict:
+    """Queue a command for the next flush and wait for its own reply."""
+    global _flush_task
+    future = asyncio.get_running_loop().create_future()
+    timeout = TIMEOUT
+    if name == "batch":
+        # The addon allows each command in an explicit batch its own limit
+        timeout *= max(1, len(arguments.get("commands", ())))
+    _pending.append((_encode_command(name, arguments), future, name not in _UNBATCHABLE, timeout))
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush())
+    return await future
+
+
+async def send_to_blender(name: str, arguments: dict) -> dict:
+    """Send a tool call to Blender over the shared connection and return the response."""
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.connect((BLENDER_HOST, BLENDER_PORT))
-            sock.settimeout(30.0)
-            
-            # Send command as JSON
-            message = json.dumps(command) + "\n"
-            sock.sendall(message.encode("utf-8"))
-            
-            # Receive response
-            response = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response += chunk
-                if response.endswith(b"\n"):
-                    break
-                    
-            return json.loads(response.decode("utf-8"))
-            
+        return await _submit(name, arguments)
     except ConnectionRefusedError:
         return {"success": False, "error": "Cannot connect to Blender. Ensure Blender is running with the MCP addon enabled."}
+    except asyncio.TimeoutError:
+        return {"success": False, "error": "Timed out waiting for Blender"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -52,698 +237,875 @@ def send_to_blender(command: dict) -> dict:
 server = Server("blender-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available Blender modeling tools."""
-    return [
-        Tool(
-            name="create_primitive",
-            description="Create a primitive mesh (Cube, UV Sphere, Cylinder, Cone, Torus, Plane)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "shape": {
-                        "type": "string",
-                        "enum": ["Cube", "Sphere", "Cylinder", "Cone", "Torus", "Plane"],
-                        "description": "Type of primitive mesh",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Object name",
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location [x, y, z]",
-                        "default": [0, 0, 0],
-                    },
-                    "size": {
-                        "type": "number",
-                        "description": "Size/scale of primitive",
-                        "default": 1,
-                    },
+# Tool schemas are static; built once at import and returned as-is
+TOOLS = [
+    Tool(
+        name="create_primitive",
+        description="Create a primitive mesh (Cube, UV Sphere, Cylinder, Cone, Torus, Plane)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "type": "string",
+                    "enum": ["Cube", "Sphere", "Cylinder", "Cone", "Torus", "Plane"],
+                    "description": "Type of primitive mesh",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Object name",
+                },
+                "location": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Location [x, y, z]",
+                    "default": [0, 0, 0],
+                },
+                "size": {
+                    "type": "number",
+                    "description": "Size/scale of primitive",
+                    "default": 1,
                 },
-                "required": ["shape"],
             },
-        ),
-        Tool(
-            name="extrude_faces",
-            description="Extrude selected faces along their normals",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "depth": {
-                        "type": "number",
-                        "description": "Extrusion distance",
-                    },
-                    "select_all": {
-                        "type": "boolean",
-                        "description": "Select all faces first",
-                        "default": False,
-                    },
+            "required": ["shape"],
+        },
+    ),
+    Tool(
+        name="extrude_faces",
+        description="Extrude selected faces along their normals",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "depth": {
+                    "type": "number",
+                    "description": "Extrusion distance",
+                },
+                "select_all": {
+                    "type": "boolean",
+                    "description": "Select all faces first",
+                    "default": False,
                 },
-                "required": ["object_name", "depth"],
             },
-        ),
-        Tool(
-            name="inset_faces",
-            description="Inset selected faces",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "thickness": {
-                        "type": "number",
-                        "description": "Inset thickness",
-                    },
-                    "depth": {
-                        "type": "number",
-                        "description": "Inset depth",
-                        "default": 0,
-                    },
+            "required": ["object_name", "depth"],
+        },
+    ),
+    Tool(
+        name="inset_faces",
+        description="Inset selected faces",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "thickness": {
+                    "type": "number",
+                    "description": "Inset thickness",
+                },
+                "depth": {
+                    "type": "number",
+                    "description": "Inset depth",
+                    "default": 0,
                 },
-                "required": ["object_name", "thickness"],
             },
-        ),
-        Tool(
-            name="bevel_edges",
-            description="Bevel selected edges",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "width": {
-                        "type": "number",
-                        "description": "Bevel width",
-                    },
-                    "segments": {
-                        "type": "integer",
-                        "description": "Number of bevel segments",
-                        "default": 1,
-                    },
+            "required": ["object_name", "thickness"],
+        },
+    ),
+    Tool(
+        name="bevel_edges",
+        description="Bevel selected edges",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "width": {
+                    "type": "number",
+                    "description": "Bevel width",
+                },
+                "segments": {
+                    "type": "integer",
+                    "description": "Number of bevel segments",
+                    "default": 1,
                 },
-                "required": ["object_name", "width"],
             },
-        ),
-        Tool(
-            name="loop_cut",
-            description="Add edge loop(s) to mesh",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "cuts": {
-                        "type": "integer",
-                        "description": "Number of cuts",
-                        "default": 1,
-                    },
-                    "edge_index": {
-                        "type": "integer",
-                        "description": "Edge index to cut through",
-                        "default": 0,
-                    },
+            "required": ["object_name", "width"],
+        },
+    ),
+    Tool(
+        name="loop_cut",
+        description="Add edge loop(s) to mesh",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "cuts": {
+                    "type": "integer",
+                    "description": "Number of cuts",
+                    "default": 1,
+                },
+                "edge_index": {
+                    "type": "integer",
+                    "description": "Edge index to cut through",
+                    "default": 0,
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="add_modifier",
-            description="Add a modifier to an object",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "modifier_type": {
-                        "type": "string",
-                        "enum": ["SUBSURF", "MIRROR", "ARRAY", "BEVEL", "SOLIDIFY", "BOOLEAN"],
-                        "description": "Type of modifier",
-                    },
-                    "params": {
-                        "type": "object",
-                        "description": "Modifier-specific parameters",
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="add_modifier",
+        description="Add a modifier to an object",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "modifier_type": {
+                    "type": "string",
+                    "enum": ["SUBSURF", "MIRROR", "ARRAY", "BEVEL", "SOLIDIFY", "BOOLEAN"],
+                    "description": "Type of modifier",
+                },
+                "params": {
+                    "type": "object",
+                    "description": "Modifier-specific parameters",
                 },
-                "required": ["object_name", "modifier_type"],
             },
-        ),
-        Tool(
-            name="apply_modifier",
-            description="Apply (bake) a modifier to mesh geometry",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "modifier_name": {
-                        "type": "string",
-                        "description": "Name of modifier to apply",
-                    },
+            "required": ["object_name", "modifier_type"],
+        },
+    ),
+    Tool(
+        name="apply_modifier",
+        description="Apply (bake) a modifier to mesh geometry",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "modifier_name": {
+                    "type": "string",
+                    "description": "Name of modifier to apply",
                 },
-                "required": ["object_name", "modifier_name"],
             },
-        ),
-        Tool(
-            name="select_geometry",
-            description="Select vertices, edges, or faces",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to select in",
-                    },
-                    "mode": {
-                        "type": "string",
-                        "enum": ["VERT", "EDGE", "FACE"],
-                        "description": "Selection mode",
-                    },
-                    "action": {
-                        "type": "string",
-                        "enum": ["SELECT_ALL", "DESELECT_ALL", "INVERT", "SELECT_INDICES"],
-                        "description": "Selection action",
-                    },
-                    "indices": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "Indices to select (for SELECT_INDICES)",
-                    },
+            "required": ["object_name", "modifier_name"],
+        },
+    ),
+    Tool(
+        name="select_geometry",
+        description="Select vertices, edges, or faces",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to select in",
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["VERT", "EDGE", "FACE"],
+                    "description": "Selection mode",
+                },
+                "action": {
+                    "type": "string",
+                    "enum": ["SELECT_ALL", "DESELECT_ALL", "INVERT", "SELECT_INDICES"],
+                    "description": "Selection action",
+                },
+                "indices": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Indices to select (for SELECT_INDICES)",
                 },
-                "required": ["object_name", "mode", "action"],
             },
-        ),
-        Tool(
-            name="transform_object",
-            description="Move, rotate, or scale an object",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to transform",
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "New location [x, y, z]",
-                    },
-                    "rotation": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Rotation in degrees [x, y, z]",
-                    },
-                    "scale": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Scale [x, y, z]",
-                    },
+            "required": ["object_name", "mode", "action"],
+        },
+    ),
+    Tool(
+        name="transform_object",
+        description="Move, rotate, or scale an object",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to transform",
+                },
+                "location": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "New location [x, y, z]",
+                },
+                "rotation": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Rotation in degrees [x, y, z]",
+                },
+                "scale": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Scale [x, y, z]",
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="delete_object",
-            description="Delete an object from the scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to delete",
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="transform_objects",
+        description="Move, rotate, or scale many objects in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Objects to transform",
+                },
+                "locations": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "number"}},
+                    "description": "New location [x, y, z] per object",
+                },
+                "rotations": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "number"}},
+                    "description": "Rotation in degrees [x, y, z] per object",
+                },
+                "scales": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "number"}},
+                    "description": "Scale [x, y, z] per object",
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="get_objects",
-            description="List all objects in the scene",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["object_names"],
+        },
+    ),
+    Tool(
+        name="delete_object",
+        description="Delete an object from the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to delete",
+                },
             },
-        ),
-        Tool(
-            name="get_screenshot",
-            description="Capture a screenshot of the viewport",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "width": {
-                        "type": "integer",
-                        "description": "Image width",
-                        "default": 800,
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Image height",
-                        "default": 600,
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="get_objects",
+        description="List all objects in the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="begin_batch",
+        description="Hold back mesh/scene updates across the following tool calls until end_batch",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="end_batch",
+        description="Apply all mesh/scene updates held back since begin_batch in one pass",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="batch",
+        description="Run several tools in one round-trip; edit-mode tools share a single edit session",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "commands": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {"type": "string"},
+                            "arguments": {"type": "object"},
+                        },
+                        "required": ["tool"],
                     },
+                    "description": "Tool calls to run in order, e.g. [{\"tool\": \"extrude_faces\", \"arguments\": {...}}]",
                 },
             },
-        ),
-        Tool(
-            name="execute_code",
-            description="Execute arbitrary Python code in Blender (advanced)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "code": {
-                        "type": "string",
-                        "description": "Python code to execute (has access to bpy module)",
-                    },
+            "required": ["commands"],
+        },
+    ),
+    Tool(
+        name="get_screenshot",
+        description="Capture a screenshot of the viewport",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {
+                    "type": "integer",
+                    "description": "Image width",
+                    "default": 800,
+                },
+                "height": {
+                    "type": "integer",
+                    "description": "Image height",
+                    "default": 600,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Write the PNG to this file and return its path instead of inline image data",
                 },
-                "required": ["code"],
             },
-        ),
-        Tool(
-            name="spin",
-            description="Spin/revolve selected geometry around an axis (lathe operation)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to spin",
-                    },
-                    "angle": {
-                        "type": "number",
-                        "description": "Spin angle in degrees (360 for full revolution)",
-                        "default": 360,
-                    },
-                    "steps": {
-                        "type": "integer",
-                        "description": "Number of steps in the revolution",
-                        "default": 12,
-                    },
-                    "axis": {
-                        "type": "string",
-                        "enum": ["X", "Y", "Z"],
-                        "description": "Axis to spin around",
-                        "default": "Z",
-                    },
-                    "center": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Center point [x, y, z]",
-                        "default": [0, 0, 0],
-                    },
+        },
+    ),
+    Tool(
+        name="execute_code",
+        description="Execute arbitrary Python code in Blender (advanced)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "code": {
+                    "type": "string",
+                    "description": "Python code to execute (has access to bpy module)",
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="screw_modifier",
-            description="Add a screw modifier (helix/spiral extrusion along axis)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to modify",
-                    },
-                    "screw_offset": {
-                        "type": "number",
-                        "description": "Screw offset distance per revolution",
-                        "default": 1,
-                    },
-                    "angle": {
-                        "type": "number",
-                        "description": "Total rotation angle in degrees",
-                        "default": 360,
-                    },
-                    "iterations": {
-                        "type": "integer",
-                        "description": "Number of screw turns",
-                        "default": 2,
-                    },
-                    "steps": {
-                        "type": "integer",
-                        "description": "Steps per revolution",
-                        "default": 16,
-                    },
-                    "axis": {
-                        "type": "string",
-                        "enum": ["X", "Y", "Z"],
-                        "description": "Screw axis",
-                        "default": "Z",
-                    },
+            "required": ["code"],
+        },
+    ),
+    Tool(
+        name="spin",
+        description="Spin/revolve selected geometry around an axis (lathe operation)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to spin",
+                },
+                "angle": {
+                    "type": "number",
+                    "description": "Spin angle in degrees (360 for full revolution)",
+                    "default": 360,
+                },
+                "steps": {
+                    "type": "integer",
+                    "description": "Number of steps in the revolution",
+                    "default": 12,
+                },
+                "axis": {
+                    "type": "string",
+                    "enum": ["X", "Y", "Z"],
+                    "description": "Axis to spin around",
+                    "default": "Z",
+                },
+                "center": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Center point [x, y, z]",
+                    "default": [0, 0, 0],
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="create_spiral",
-            description="Create a spiral/helix curve",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "turns": {
-                        "type": "number",
-                        "description": "Number of spiral turns",
-                        "default": 2,
-                    },
-                    "steps": {
-                        "type": "integer",
-                        "description": "Points per turn (smoothness)",
-                        "default": 24,
-                    },
-                    "radius_start": {
-                        "type": "number",
-                        "description": "Starting radius",
-                        "default": 1,
-                    },
-                    "radius_end": {
-                        "type": "number",
-                        "description": "Ending radius (same as start for uniform helix)",
-                        "default": 1,
-                    },
-                    "height": {
-                        "type": "number",
-                        "description": "Total height of spiral",
-                        "default": 2,
-                    },
-                    "direction": {
-                        "type": "string",
-                        "enum": ["CLOCKWISE", "COUNTER_CLOCKWISE"],
-                        "description": "Spiral direction",
-                        "default": "COUNTER_CLOCKWISE",
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="screw_modifier",
+        description="Add a screw modifier (helix/spiral extrusion along axis)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to modify",
+                },
+                "screw_offset": {
+                    "type": "number",
+                    "description": "Screw offset distance per revolution",
+                    "default": 1,
+                },
+                "angle": {
+                    "type": "number",
+                    "description": "Total rotation angle in degrees",
+                    "default": 360,
+                },
+                "iterations": {
+                    "type": "integer",
+                    "description": "Number of screw turns",
+                    "default": 2,
+                },
+                "steps": {
+                    "type": "integer",
+                    "description": "Steps per revolution",
+                    "default": 16,
+                },
+                "axis": {
+                    "type": "string",
+                    "enum": ["X", "Y", "Z"],
+                    "description": "Screw axis",
+                    "default": "Z",
                 },
             },
-        ),
-        Tool(
-            name="curve_to_mesh",
-            description="Convert a curve to mesh geometry",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Curve object to convert",
-                    },
-                    "bevel_depth": {
-                        "type": "number",
-                        "description": "Bevel depth (pipe radius)",
-                        "default": 0,
-                    },
-                    "bevel_resolution": {
-                        "type": "integer",
-                        "description": "Bevel resolution (smoothness)",
-                        "default": 4,
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="create_spiral",
+        description="Create a spiral/helix curve",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "turns": {
+                    "type": "number",
+                    "description": "Number of spiral turns",
+                    "default": 2,
+                },
+                "steps": {
+                    "type": "integer",
+                    "description": "Points per turn (smoothness)",
+                    "default": 24,
+                },
+                "radius_start": {
+                    "type": "number",
+                    "description": "Starting radius",
+                    "default": 1,
+                },
+                "radius_end": {
+                    "type": "number",
+                    "description": "Ending radius (same as start for uniform helix)",
+                    "default": 1,
+                },
+                "height": {
+                    "type": "number",
+                    "description": "Total height of spiral",
+                    "default": 2,
+                },
+                "direction": {
+                    "type": "string",
+                    "enum": ["CLOCKWISE", "COUNTER_CLOCKWISE"],
+                    "description": "Spiral direction",
+                    "default": "COUNTER_CLOCKWISE",
                 },
-                "required": ["object_name"],
             },
-        ),
-        # === HIGH-PRIORITY MESH TOOLS FOR 3D PRINTING ===
-        Tool(
-            name="fill_holes",
-            description="Fill holes/gaps in mesh by creating faces on boundary edges",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to fill",
-                    },
-                    "sides": {
-                        "type": "integer",
-                        "description": "Maximum sides of hole to fill (0 = all)",
-                        "default": 0,
-                    },
+        },
+    ),
+    Tool(
+        name="curve_to_mesh",
+        description="Convert a curve to mesh geometry",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Curve object to convert",
+                },
+                "bevel_depth": {
+                    "type": "number",
+                    "description": "Bevel depth (pipe radius)",
+                    "default": 0,
+                },
+                "bevel_resolution": {
+                    "type": "integer",
+                    "description": "Bevel resolution (smoothness)",
+                    "default": 4,
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="bridge_edges",
-            description="Bridge two edge loops to create connecting faces",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object",
-                    },
-                    "edge_indices_1": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "First edge loop indices",
-                    },
-                    "edge_indices_2": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "Second edge loop indices",
-                    },
-                    "segments": {
-                        "type": "integer",
-                        "description": "Number of bridge segments",
-                        "default": 1,
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    # === HIGH-PRIORITY MESH TOOLS FOR 3D PRINTING ===
+    Tool(
+        name="fill_holes",
+        description="Fill holes/gaps in mesh by creating faces on boundary edges",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to fill",
+                },
+                "sides": {
+                    "type": "integer",
+                    "description": "Maximum sides of hole to fill (0 = all)",
+                    "default": 0,
                 },
-                "required": ["object_name", "edge_indices_1", "edge_indices_2"],
             },
-        ),
-        Tool(
-            name="subdivide_mesh",
-            description="Subdivide mesh geometry to increase detail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to subdivide",
-                    },
-                    "cuts": {
-                        "type": "integer",
-                        "description": "Number of cuts per edge",
-                        "default": 1,
-                    },
-                    "smoothness": {
-                        "type": "number",
-                        "description": "Smooth factor (0-1)",
-                        "default": 0,
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="bridge_edges",
+        description="Bridge two edge loops to create connecting faces",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object",
+                },
+                "edge_indices_1": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "First edge loop indices",
+                },
+                "edge_indices_2": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Second edge loop indices",
+                },
+                "segments": {
+                    "type": "integer",
+                    "description": "Number of bridge segments",
+                    "default": 1,
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="merge_vertices",
-            description="Merge selected or nearby vertices",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object",
-                    },
-                    "merge_type": {
-                        "type": "string",
-                        "enum": ["CENTER", "AT_FIRST", "AT_LAST", "BY_DISTANCE"],
-                        "description": "How to merge vertices",
-                        "default": "BY_DISTANCE",
-                    },
-                    "threshold": {
-                        "type": "number",
-                        "description": "Distance threshold for BY_DISTANCE mode",
-                        "default": 0.0001,
-                    },
+            "required": ["object_name", "edge_indices_1", "edge_indices_2"],
+        },
+    ),
+    Tool(
+        name="subdivide_mesh",
+        description="Subdivide mesh geometry to increase detail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to subdivide",
+                },
+                "cuts": {
+                    "type": "integer",
+                    "description": "Number of cuts per edge",
+                    "default": 1,
+                },
+                "smoothness": {
+                    "type": "number",
+                    "description": "Smooth factor (0-1)",
+                    "default": 0,
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="export_stl",
-            description="Export object to STL for 3D printing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to export",
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "Output STL file path",
-                    },
-                    "ascii": {
-                        "type": "boolean",
-                        "description": "ASCII format vs binary",
-                        "default": False,
-                    },
-                    "apply_modifiers": {
-                        "type": "boolean",
-                        "description": "Apply modifiers before export",
-                        "default": True,
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="merge_vertices",
+        description="Merge selected or nearby vertices",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object",
+                },
+                "merge_type": {
+                    "type": "string",
+                    "enum": ["CENTER", "AT_FIRST", "AT_LAST", "BY_DISTANCE"],
+                    "description": "How to merge vertices",
+                    "default": "BY_DISTANCE",
+                },
+                "threshold": {
+                    "type": "number",
+                    "description": "Distance threshold for BY_DISTANCE mode",
+                    "default": 0.0001,
                 },
-                "required": ["object_name", "file_path"],
             },
-        ),
-        Tool(
-            name="get_mesh_stats",
-            description="Get mesh statistics for validation (vertices, faces, manifold status)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to analyze",
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="export_stl",
+        description="Export object to STL for 3D printing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to export",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "Output STL file path",
+                },
+                "ascii": {
+                    "type": "boolean",
+                    "description": "ASCII format vs binary",
+                    "default": False,
+                },
+                "apply_modifiers": {
+                    "type": "boolean",
+                    "description": "Apply modifiers before export",
+                    "default": True,
                 },
-                "required": ["object_name"],
             },
-        ),
-        Tool(
-            name="knife_cut",
-            description="Cut through mesh geometry with a line",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to cut",
-                    },
-                    "cut_start": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Start point [x, y, z]",
-                    },
-                    "cut_end": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "End point [x, y, z]",
-                    },
-                    "cut_through": {
-                        "type": "boolean",
-                        "description": "Cut through entire mesh",
-                        "default": True,
-                    },
+            "required": ["object_name", "file_path"],
+        },
+    ),
+    Tool(
+        name="get_mesh_stats",
+        description="Get mesh statistics for validation (vertices, faces, manifold status)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to analyze",
                 },
-                "required": ["object_name", "cut_start", "cut_end"],
             },
-        ),
-        Tool(
-            name="assign_material",
-            description="Create and assign a material to an object",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Object to assign material to",
-                    },
-                    "material_name": {
-                        "type": "string",
-                        "description": "Name for the material",
-                    },
-                    "color": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "RGB color values [0-1, 0-1, 0-1]",
-                        "default": [0.8, 0.8, 0.8],
-                    },
-                    "metallic": {
-                        "type": "number",
-                        "description": "Metallic factor (0-1)",
-                        "default": 0,
-                    },
-                    "roughness": {
-                        "type": "number",
-                        "description": "Roughness factor (0-1)",
-                        "default": 0.5,
-                    },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="knife_cut",
+        description="Cut through mesh geometry with a line",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to cut",
+                },
+                "cut_start": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Start point [x, y, z]",
+                },
+                "cut_end": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "End point [x, y, z]",
+                },
+                "cut_through": {
+                    "type": "boolean",
+                    "description": "Cut through entire mesh",
+                    "default": True,
                 },
-                "required": ["object_name", "material_name"],
             },
-        ),
-        Tool(
-            name="fillet_edges",
-            description="Apply rounded fillet to selected edges (smooth radius)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to fillet",
-                    },
-                    "radius": {
-                        "type": "number",
-                        "description": "Fillet radius",
-                    },
-                    "segments": {
-                        "type": "integer",
-                        "description": "Number of segments for smoothness (higher = smoother)",
-                        "default": 4,
-                    },
-                    "edge_indices": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "Edge indices to fillet (empty = all edges)",
-                        "default": [],
-                    },
+            "required": ["object_name", "cut_start", "cut_end"],
+        },
+    ),
+    Tool(
+        name="assign_material",
+        description="Create and assign a material to an object",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object to assign material to",
+                },
+                "material_name": {
+                    "type": "string",
+                    "description": "Name for the material",
+                },
+                "color": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "RGB color values [0-1, 0-1, 0-1]",
+                    "default": [0.8, 0.8, 0.8],
+                },
+                "metallic": {
+                    "type": "number",
+                    "description": "Metallic factor (0-1)",
+                    "default": 0,
+                },
+                "roughness": {
+                    "type": "number",
+                    "description": "Roughness factor (0-1)",
+                    "default": 0.5,
                 },
-                "required": ["object_name", "radius"],
             },
-        ),
-        Tool(
-            name="chamfer_edges",
-            description="Apply flat chamfer/bevel to selected edges (angled cut)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Mesh object to chamfer",
-                    },
-                    "size": {
-                        "type": "number",
-                        "description": "Chamfer size (width)",
-                    },
-                    "edge_indices": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "Edge indices to chamfer (empty = all edges)",
-                        "default": [],
-                    },
+            "required": ["object_name", "material_name"],
+        },
+    ),
+    Tool(
+        name="assign_materials",
+        description="Create and assign materials to many objects in one call; identical materials are built once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "assignments": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "object_name": {"type": "string"},
+                            "material_name": {"type": "string"},
+                            "color": {
+                                "type": "array",
+                                "items": {"type": "number"},
+                                "default": [0.8, 0.8, 0.8],
+                            },
+                            "metallic": {"type": "number", "default": 0},
+                            "roughness": {"type": "number", "default": 0.5},
+                        },
+                        "required": ["object_name", "material_name"],
+                    },
+                    "description": "One entry per object",
+                },
+            },
+            "required": ["assignments"],
+        },
+    ),
+    Tool(
+        name="fillet_edges",
+        description="Apply rounded fillet to selected edges (smooth radius)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to fillet",
+                },
+                "radius": {
+                    "type": "number",
+                    "description": "Fillet radius",
+                },
+                "segments": {
+                    "type": "integer",
+                    "description": "Number of segments for smoothness (higher = smoother)",
+                    "default": 4,
+                },
+                "edge_indices": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Edge indices to fillet (empty = all edges)",
+                    "default": [],
+                },
+            },
+            "required": ["object_name", "radius"],
+        },
+    ),
+    Tool(
+        name="chamfer_edges",
+        description="Apply flat chamfer/bevel to selected edges (angled cut)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Mesh object to chamfer",
+                },
+                "size": {
+                    "type": "number",
+                    "description": "Chamfer size (width)",
+                },
+                "edge_indices": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Edge indices to chamfer (empty = all edges)",
+                    "default": [],
+                },
+            },
+            "required": ["object_name", "size"],
+        },
+    ),
+    Tool(
+        name="bevel_batch",
+        description="Fillet or chamfer edges on many objects at once; objects sharing radius/segments/profile are bevelled in one pass",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bevels": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "object_name": {"type": "string"},
+                            "radius": {"type": "number"},
+                            "segments": {"type": "integer", "default": 4},
+                            "profile": {
+                                "type": "number",
+                                "description": "1.0 = rounded fillet, 0.5 = flat chamfer",
+                                "default": 1.0,
+                            },
+                            "edge_indices": {
+                                "type": "array",
+                                "items": {"type": "integer"},
+                                "default": [],
+                            },
+                        },
+                        "required": ["object_name", "radius"],
+                    },
+                    "description": "Per-object bevel settings (empty edge_indices = all edges)",
                 },
-                "required": ["object_name", "size"],
             },
-        ),
-    ]
+            "required": ["bevels"],
+        },
+    ),
+]
+
+# One validator per tool, built once. The SDK's default per-call
+# jsonschema.validate() re-checks the schema and rebuilds a validator on
+# every request, which costs far more than validating the arguments.
+_VALIDATORS = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in TOOLS
+}
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available Blender modeling tools."""
+    return TOOLS
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | ImageContent]:
     """Execute a Blender modeling tool."""
-    command = {
-        "tool": name,
-        "arguments": arguments,
-    }
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+        if error is not None:
+            # Rejected locally, without a round-trip to Blender
+            return [TextContent(type="text", text=f"Error: Input validation error: {error.message}")]
     
-    result = send_to_blender(command)
+    result = await send_to_blender(name, arguments)
     
+    raw = result.pop("raw", None)
+    binary = result.pop("binary", None)
+    if result.get("success") and binary is not None:
+        # Screenshot: raw PNG from the addon, base64 only for MCP
+        info = result.get("result", {})
+        output_path = arguments.get("output_path")
+        if output_path:
+            # Bytes go straight to disk, skipping the base64 round-trip;
+            # the write runs on a worker thread so the loop keeps serving
+            await asyncio.to_thread(Path(output_path).write_bytes, binary)
+            return [TextContent(
+                type="text",
+                text=f"Screenshot: {info.get('width', 800)}x{info.get('height', 600)}px saved to {output_path}",
+            )]
+        data = await asyncio.to_thread(base64.b64encode, binary)
+        return [
+            ImageContent(
+                type="image",
+                data=data.decode("ascii"),
+                mimeType=f"image/{info.get('image_format', 'png')}",
+            ),
+            TextContent(
+                type="text",
+                text=f"Screenshot: {info.get('width', 800)}x{info.get('height', 600)}px",
+            ),
+        ]
     if result.get("success"):
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        # Batched replies have no frame of their own to forward
+        if raw is None:
+            raw = _json_dumps(result)
+        return [TextContent(type="text", text=raw.decode("utf-8"))]
     else:
         return [TextContent(
             type="text",
@@ -759,7 +1121,10 @@ def main():
         async with stdio_server() as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
     
-    asyncio.run(run())
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 
 if __name__ == "__main__":
@@ -1,19 +1,34 @@
 import json
 import base64
+import mmap
 import os
 
 input_path = "/Users/nbiish/.gemini/antigravity/brain/ae39688a-df39-4ec5-8cd7-9dc2345637d7/.system_generated/steps/1042/output.txt"
 output_path = "/Users/nbiish/.gemini/antigravity/brain/ae39688a-df39-4ec5-8cd7-9dc2345637d7/chamfered_bolt.png"
 
+# Decode in 4-aligned slices so each piece is valid base64 on its own
+CHUNK_SIZE = 1 << 16
+
 try:
-    with open(input_path, 'r') as f:
-        data = json.load(f)
-        # Handle the structure returned by the tool (sometimes it's wrapped in result, sometimes effectively flat if read from file)
+    with open(input_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
         # The file content shown in view_file was: {"success": true, "result": {"image_base64": "..."}}
-        b64_str = data['result']['image_base64']
-        
-    with open(output_path, 'wb') as f:
-        f.write(base64.b64decode(b64_str))
+        # Locate the image_base64 string in place rather than json.load-ing the whole document
+        key = buf.find(b'"image_base64"')
+        if key < 0:
+            raise KeyError('image_base64')
+        start = buf.find(b'"', buf.find(b':', key + len(b'"image_base64"'))) + 1
+        end = buf.find(b'"', start)
+        b64 = memoryview(buf)[start:end]
+        try:
+            with open(output_path, 'wb') as out:
+                if buf.find(b'\\', start, end) >= 0:
+                    # JSON escapes (e.g. "\/") present; fall back to a real parse
+                    out.write(base64.b64decode(json.loads(bytes(buf))['result']['image_base64']))
+                else:
+                    for i in range(0, len(b64), CHUNK_SIZE):
+                        out.write(base64.b64decode(b64[i:i + CHUNK_SIZE]))
+        finally:
+            b64.release()
     print(f"Success: {output_path}")
 except Exception as e:
     print(f"Error: {e}")
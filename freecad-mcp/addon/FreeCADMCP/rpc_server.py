@@ -1,16 +1,20 @@
 """FreeCAD MCP Addon — XML-RPC bridge (4 handlers).
 
 Handlers: execute_code, get_model_info, get_selection, get_screenshot
+The same handlers are also served as length-prefixed JSON on a second port.
 All FreeCAD operations dispatch to Qt main thread to avoid macOS crashes.
 """
 
+import contextlib
+import functools
 import io
 import json
-import queue
-import sys
+import os
+import socket
+import socketserver
 import threading
 import traceback
-from xmlrpc.server import SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 from typing import Any
 
 # FreeCAD imports
@@ -23,6 +27,44 @@ try:
 except ImportError:
     FREECAD_AVAILABLE = False
 
+# Template globals for execute_code, built once; each run gets a shallow
+# copy so scripts still start from a clean namespace
+_EXEC_GLOBALS = {"__builtins__": __builtins__}
+if FREECAD_AVAILABLE:
+    _EXEC_GLOBALS.update({
+        "App": App, "FreeCAD": App,
+        "Gui": Gui, "FreeCADGui": Gui,
+        "Part": Part, "Sketcher": Sketcher,
+    })
+
+# orjson is several times faster on large results (screenshot base64);
+# compact stdlib json is the fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Full tracebacks in error replies are opt-in; by default an error is
+# reported as "ExceptionType: message", which skips walking frames and
+# reading source lines
+DEBUG = bool(os.environ.get("CAID_MCP_DEBUG"))
+
+# Length-prefixed JSON listener: 4-byte little-endian size, then that
+# many bytes of JSON, in both directions
+HEADER_SIZE = 4
+MAX_MSG_SIZE = 64 * 1024 * 1024
+
+# Shape-derived fields get_model_info can report; all of them by default
+_MODEL_INFO_FIELDS = frozenset({"dimensions", "edges", "faces"})
+
 # PySide6/PySide2 compatibility
 try:
     from PySide6 import QtCore
@@ -30,71 +72,229 @@ except ImportError:
     from PySide2 import QtCore
 
 
+def _error_reply(e: Exception) -> str:
+    error = traceback.format_exc() if DEBUG else f"{type(e).__name__}: {e}"
+    return _json_dumps({"success": False, "error": error})
+
+
+def _round3(v: float) -> float:
+    """round(v, 3) by integer scaling, cheaper than float.__round__."""
+    try:
+        return int(v * 1000.0 + (0.5 if v >= 0 else -0.5)) / 1000.0
+    except (OverflowError, ValueError):
+        return v  # inf/nan pass through as round() would
+
+
+def _round2(v: float) -> float:
+    """round(v, 2) by integer scaling, cheaper than float.__round__."""
+    try:
+        return int(v * 100.0 + (0.5 if v >= 0 else -0.5)) / 100.0
+    except (OverflowError, ValueError):
+        return v
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_cached(code: str):
+    """Compile an execute_code snippet once; agents often resend the same one."""
+    return compile(code, "<mcp>", "exec")
+
+
 class MainThreadDispatcher(QtCore.QObject):
     """Dispatch function calls to Qt main thread."""
 
-    execute_signal = QtCore.Signal(object, object)
+    execute_signal = QtCore.Signal(object, object, object, object)
 
     def __init__(self):
         super().__init__()
-        self.result_queue = queue.Queue()
         self.execute_signal.connect(self._run)
+        # Bound once; dispatch() runs on every RPC
+        self._emit = self.execute_signal.emit
 
-    def _run(self, func, args):
+    def _run(self, func, args, slot, done):
+        # Each dispatch brings its own result slot, so concurrent callers
+        # (and late results after a timeout) never see each other's output
         try:
-            result = func(*args)
-            self.result_queue.put(("ok", result))
+            slot[:] = ("ok", func(*args))
         except Exception as e:
-            self.result_queue.put(("err", traceback.format_exc()))
+            # Re-raised in the calling thread, traceback attached
+            slot[:] = ("err", e)
+        done.set()
 
     def dispatch(self, func, *args, timeout=30):
-        self.execute_signal.emit(func, args)
-        try:
-            status, result = self.result_queue.get(timeout=timeout)
-            if status == "ok":
-                return result
-            raise RuntimeError(result)
-        except queue.Empty:
+        slot = [None, None]
+        done = threading.Event()
+        self._emit(func, args, slot, done)
+        # Emitting from the main thread runs _run synchronously; is_set()
+        # skips wait()'s condition lock in that case
+        if not done.is_set() and not done.wait(timeout):
             raise RuntimeError("Timeout waiting for main thread")
+        status, result = slot
+        if status == "ok":
+            return result
+        raise result
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """Speak HTTP/1.1 so a client can reuse one connection across calls."""
+
+    protocol_version = "HTTP/1.1"
+    # Small replies go out immediately instead of waiting on Nagle
+    disable_nagle_algorithm = True
+
+
+class ConnectionTrackingMixIn:
+    """Close persistent client connections along with the server.
+
+    Handler threads of keep-alive connections otherwise outlive
+    shutdown() and keep serving through the stopped server.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._connections = set()
+        super().__init__(*args, **kwargs)
+
+    def finish_request(self, request, client_address):
+        self._connections.add(request)
+        try:
+            super().finish_request(request, client_address)
+        finally:
+            self._connections.discard(request)
+
+    def server_close(self):
+        super().server_close()
+        for conn in list(self._connections):
+            with contextlib.suppress(OSError):
+                conn.shutdown(socket.SHUT_RDWR)
+
+
+class ThreadingXMLRPCServer(ConnectionTrackingMixIn, socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server handling each request on its own thread.
+
+    HTTP parsing and marshalling of one request overlap with others;
+    FreeCAD work is still serialized on the Qt main thread.
+    """
+
+    daemon_threads = True
+
+
+class JSONRequestHandler(socketserver.StreamRequestHandler):
+    """Serve length-prefixed {"tool", "arguments"} requests until the client hangs up."""
+
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        while True:
+            header = self.rfile.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                return  # Client disconnected
+            size = int.from_bytes(header, "little")
+            if size > MAX_MSG_SIZE:
+                # Framing is lost: report and hang up
+                self._reply(_json_dumps({"success": False, "error": f"Message too large: {size} bytes"}))
+                return
+            data = self.rfile.read(size)
+            if len(data) < size:
+                return
+            try:
+                command = _json_loads(data)
+                if not isinstance(command, dict):
+                    raise TypeError(f"Expected a JSON object, got {type(command).__name__}")
+            except Exception as e:
+                self._reply(_error_reply(e))
+                continue
+            self._reply(self.server.mcp.run_tool(command.get("tool"), command.get("arguments", {})))
+
+    def _reply(self, payload: str):
+        body = payload.encode("utf-8")
+        self.wfile.write(len(body).to_bytes(HEADER_SIZE, "little") + body)
+
+
+class ThreadingJSONServer(ConnectionTrackingMixIn, socketserver.ThreadingTCPServer):
+    """JSON counterpart of ThreadingXMLRPCServer, without HTTP or XML."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, mcp):
+        self.mcp = mcp
+        super().__init__(address, JSONRequestHandler)
 
 
 class FreeCADMCPServer:
     """Minimal XML-RPC server for FreeCAD MCP bridge."""
 
-    def __init__(self, host="localhost", port=9875):
+    def __init__(self, host="localhost", port=9875, json_port=9874):
         self.host = host
         self.port = port
+        self.json_port = json_port
         self.server = None
         self.thread = None
+        self.json_server = None
         self.dispatcher = None
+        self._out_buf = io.StringIO()
+        self._err_buf = io.StringIO()
+        self._shot_path = None
+        # Tool name -> bound handler, resolved once
+        self._dispatch = {
+            name[len("_tool_"):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_tool_")
+        }
 
     def start(self):
         self.dispatcher = MainThreadDispatcher()
-        self.server = SimpleXMLRPCServer(
-            (self.host, self.port), allow_none=True, logRequests=False
+        self.server = ThreadingXMLRPCServer(
+            (self.host, self.port),
+            requestHandler=KeepAliveRequestHandler,
+            allow_none=True,
+            logRequests=False,
         )
         self.server.register_function(self.execute_tool, "execute_tool")
         self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
         self.thread.start()
-        print(f"FreeCAD MCP Server started on {self.host}:{self.port}")
+        # The MCP client falls back to XML-RPC, so a taken JSON port must
+        # not fail startup
+        try:
+            self.json_server = ThreadingJSONServer((self.host, self.json_port), self)
+        except OSError as e:
+            self.json_server = None
+            print(f"FreeCAD MCP: JSON listener unavailable on {self.host}:{self.json_port} ({e}); XML-RPC only")
+            listeners = ""
+        else:
+            threading.Thread(target=self.json_server.serve_forever, daemon=True).start()
+            listeners = f" (JSON on {self.json_port})"
+        print(f"FreeCAD MCP Server started on {self.host}:{self.port}{listeners}")
 
     def stop(self):
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
+            if self.json_server:
+                self.json_server.shutdown()
+                self.json_server.server_close()
+                self.json_server = None
             print("FreeCAD MCP Server stopped")
 
     def execute_tool(self, tool_name: str, arguments_json: str) -> str:
-        """Route tool call to handler, run on main thread."""
+        """XML-RPC entry point: decode the arguments and run the tool."""
+        try:
+            args = _json_loads(arguments_json)
+        except Exception as e:
+            return _error_reply(e)
+        return self.run_tool(tool_name, args)
+
+    def run_tool(self, tool_name: str, args: dict) -> str:
+        """Route tool call to handler, run on main thread; returns the JSON reply."""
         try:
-            args = json.loads(arguments_json)
-            handler = getattr(self, f"_tool_{tool_name}", None)
+            handler = self._dispatch.get(tool_name)
             if not handler:
-                return json.dumps({"success": False, "error": f"Unknown tool: {tool_name}"})
+                return _json_dumps({"success": False, "error": f"Unknown tool: {tool_name}"})
             result = self.dispatcher.dispatch(handler, args)
-            return json.dumps({"success": True, "result": result})
+            # Constant envelope; only the result itself needs encoding
+            return '{"success":true,"result":' + _json_dumps(result) + "}"
         except Exception as e:
-            return json.dumps({"success": False, "error": traceback.format_exc()})
+            return _error_reply(e)
 
     # === Tool Handlers ===
 
@@ -104,17 +304,16 @@ class FreeCADMCPServer:
         if not code.strip():
             return {"output": ""}
 
-        old_stdout, old_stderr = sys.stdout, sys.stderr
-        sys.stdout = out_buf = io.StringIO()
-        sys.stderr = err_buf = io.StringIO()
+        # Handlers only ever run on the Qt main thread, so one pair of
+        # buffers is reused instead of allocating two per call
+        out_buf, err_buf = self._out_buf, self._err_buf
+        for buf in (out_buf, err_buf):
+            buf.seek(0)
+            buf.truncate()
 
         try:
-            exec(code, {
-                "__builtins__": __builtins__,
-                "App": App, "FreeCAD": App,
-                "Gui": Gui, "FreeCADGui": Gui,
-                "Part": Part, "Sketcher": Sketcher,
-            })
+            with contextlib.redirect_stdout(out_buf), contextlib.redirect_stderr(err_buf):
+                exec(_compile_cached(code), _EXEC_GLOBALS.copy())
             output = out_buf.getvalue()
             errors = err_buf.getvalue()
             result = output if output else "OK"
@@ -123,9 +322,6 @@ class FreeCADMCPServer:
             return {"output": result}
         except Exception:
             return {"output": f"Error:\n{traceback.format_exc()}"}
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
 
     def _tool_get_model_info(self, args: dict[str, Any]) -> dict:
         """Get objects and dimensions from current document."""
@@ -136,21 +332,52 @@ class FreeCADMCPServer:
         target = args.get("object_name", "")
         info = {"document": doc.Name, "objects": []}
 
-        for obj in doc.Objects:
-            if target and obj.Name != target:
-                continue
+        if target:
+            # Direct lookup by internal name instead of scanning the document
+            obj = doc.getObject(target)
+            objects = [obj] if obj is not None else []
+        else:
+            objects = doc.Objects
+
+        # Shape-derived fields are OCCT computations; callers that only need
+        # a listing can ask for fewer (or none) of them
+        requested = args.get("fields")
+        if requested is None:
+            fields = _MODEL_INFO_FIELDS
+        elif isinstance(requested, (list, tuple)) and all(isinstance(f, str) for f in requested):
+            fields = _MODEL_INFO_FIELDS.intersection(requested)
+        else:
+            # A bare string would otherwise be matched character by character
+            return {"error": "fields must be a list of field names"}
+        want_dims = "dimensions" in fields
+        want_edges = "edges" in fields
+        want_faces = "faces" in fields
+
+        for obj in objects:
             obj_info = {"name": obj.Name, "label": obj.Label, "type": obj.TypeId}
-            if hasattr(obj, "Shape") and obj.Shape.Volume > 0:
-                bb = obj.Shape.BoundBox
-                obj_info["dimensions"] = {
-                    "length": round(bb.XMax - bb.XMin, 3),
-                    "width": round(bb.YMax - bb.YMin, 3),
-                    "height": round(bb.ZMax - bb.ZMin, 3),
-                    "volume": round(obj.Shape.Volume, 3),
-                    "area": round(obj.Shape.Area, 3),
-                }
-                obj_info["edges"] = len(obj.Shape.Edges)
-                obj_info["faces"] = len(obj.Shape.Faces)
+            if not fields:
+                info["objects"].append(obj_info)
+                continue
+            # Each obj.Shape / shape.BoundBox access builds a new wrapper
+            # around the OCCT data, so read them once per object
+            shape = getattr(obj, "Shape", None)
+            # Only solids report shape data; Volume is the gate, and it
+            # is only computed when some shape field was asked for
+            volume = shape.Volume if shape is not None else 0
+            if volume > 0:
+                if want_dims:
+                    bb = shape.BoundBox
+                    obj_info["dimensions"] = {
+                        "length": _round3(bb.XLength),
+                        "width": _round3(bb.YLength),
+                        "height": _round3(bb.ZLength),
+                        "volume": _round3(volume),
+                        "area": _round3(shape.Area),
+                    }
+                if want_edges:
+                    obj_info["edges"] = len(shape.Edges)
+                if want_faces:
+                    obj_info["faces"] = len(shape.Faces)
             info["objects"].append(obj_info)
 
         return info
@@ -168,34 +395,32 @@ class FreeCADMCPServer:
 
             if s.SubElementNames:
                 subs = []
-                for sub_name in s.SubElementNames:
+                # SubObjects holds the already-resolved sub-shapes; looking
+                # each one up again with getElement re-walks the topology
+                sub_shapes = s.SubObjects
+                for i, sub_name in enumerate(s.SubElementNames):
                     sub_info = {"name": sub_name}
                     try:
-                        sub_shape = obj.Shape.getElement(sub_name)
+                        sub_shape = sub_shapes[i] if i < len(sub_shapes) else obj.Shape.getElement(sub_name)
                         sub_info["shape_type"] = sub_shape.__class__.__name__
                         bb = sub_shape.BoundBox
                         sub_info["bounds"] = {
-                            "x": [round(bb.XMin, 2), round(bb.XMax, 2)],
-                            "y": [round(bb.YMin, 2), round(bb.YMax, 2)],
-                            "z": [round(bb.ZMin, 2), round(bb.ZMax, 2)],
+                            "x": [_round2(bb.XMin), _round2(bb.XMax)],
+                            "y": [_round2(bb.YMin), _round2(bb.YMax)],
+                            "z": [_round2(bb.ZMin), _round2(bb.ZMax)],
                         }
-                        sub_info["center"] = [
-                            round(sub_shape.CenterOfMass.x, 2),
-                            round(sub_shape.CenterOfMass.y, 2),
-                            round(sub_shape.CenterOfMass.z, 2),
-                        ]
-                        if hasattr(sub_shape, "Surface"):
-                            surf = sub_shape.Surface
-                            if hasattr(surf, "Axis"):
-                                sub_info["normal"] = [
-                                    round(surf.Axis.x, 3),
-                                    round(surf.Axis.y, 3),
-                                    round(surf.Axis.z, 3),
-                                ]
-                        if hasattr(sub_shape, "Length"):
-                            sub_info["length"] = round(sub_shape.Length, 3)
-                        if hasattr(sub_shape, "Area"):
-                            sub_info["area"] = round(sub_shape.Area, 3)
+                        com = sub_shape.CenterOfMass
+                        sub_info["center"] = [_round2(com.x), _round2(com.y), _round2(com.z)]
+                        # getattr once: hasattr() would compute each property twice
+                        axis = getattr(getattr(sub_shape, "Surface", None), "Axis", None)
+                        if axis is not None:
+                            sub_info["normal"] = [_round3(axis.x), _round3(axis.y), _round3(axis.z)]
+                        length = getattr(sub_shape, "Length", None)
+                        if length is not None:
+                            sub_info["length"] = _round3(length)
+                        area = getattr(sub_shape, "Area", None)
+                        if area is not None:
+                            sub_info["area"] = _round3(area)
                     except Exception as e:
                         sub_info["error"] = str(e)
                     subs.append(sub_info)
@@ -206,8 +431,9 @@ class FreeCADMCPServer:
 
     def _tool_get_screenshot(self, args: dict[str, Any]) -> dict:
         """Capture screenshot of current FreeCAD 3D view."""
+        import atexit
         import base64
-        import os
+        import shutil
         import tempfile
 
         width = args.get("width", 800)
@@ -217,22 +443,22 @@ class FreeCADMCPServer:
         if not view:
             return {"error": "No active view"}
 
-        fd, filepath = tempfile.mkstemp(suffix=".png")
-        os.close(fd)
+        # One private directory per server, with the PNG overwritten in place
+        # on each call rather than a new temp file created and unlinked
+        if self._shot_path is None:
+            shot_dir = tempfile.mkdtemp(prefix="caid_shot_")
+            atexit.register(shutil.rmtree, shot_dir, ignore_errors=True)
+            self._shot_path = os.path.join(shot_dir, "shot.png")
 
-        try:
-            view.saveImage(filepath, width, height, "White")
-            with open(filepath, "rb") as f:
-                image_b64 = base64.b64encode(f.read()).decode("utf-8")
-            return {
-                "image_base64": image_b64,
-                "width": width,
-                "height": height,
-                "format": "png",
-            }
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
+        view.saveImage(self._shot_path, width, height, "White")
+        with open(self._shot_path, "rb") as f:
+            image_b64 = base64.b64encode(f.read()).decode("utf-8")
+        return {
+            "image_base64": image_b64,
+            "width": width,
+            "height": height,
+            "format": "png",
+        }
 
 
 # === Module-level API ===
@@ -240,11 +466,11 @@ class FreeCADMCPServer:
 _server = None
 
 
-def start_server(host="localhost", port=9875):
+def start_server(host="localhost", port=9875, json_port=9874):
     """Start the FreeCAD MCP server."""
     global _server
     if _server is None:
-        _server = FreeCADMCPServer(host, port)
+        _server = FreeCADMCPServer(host, port, json_port)
         _server.start()
     return _server
 
@@ -6,6 +6,8 @@ See llms.txt/FREECAD_RESOURCES.md for scripting patterns.
 
 import json
 import os
+import select
+import socket
 import xmlrpc.client
 from typing import Any
 
@@ -16,19 +18,112 @@ from mcp.types import Tool, TextContent, ImageContent
 # Configuration
 FREECAD_HOST = os.environ.get("FREECAD_HOST", "localhost")
 FREECAD_PORT = int(os.environ.get("FREECAD_PORT", "9875"))
+FREECAD_JSON_PORT = int(os.environ.get("FREECAD_JSON_PORT", "9874"))
+
+# Wire format of the addon's JSON listener: 4-byte little-endian length
+# prefix, then that many bytes of JSON
+HEADER_SIZE = 4
+# Above the addon's own 30 s limit, so its timeout reply arrives first
+TIMEOUT = 60.0
+
+
+class _JSONConnection:
+    """A persistent connection to the addon's length-prefixed JSON listener."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._sock = None
+        self._rfile = None
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=TIMEOUT)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._rfile = self._sock.makefile("rb")
+
+    def _close(self):
+        if self._sock is not None:
+            self._rfile.close()
+            self._sock.close()
+        self._sock = self._rfile = None
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = self._rfile.read(size)
+        if len(data) < size:
+            raise ConnectionResetError("FreeCAD closed the connection")
+        return data
+
+    def _is_stale(self) -> bool:
+        # Between requests the addon sends nothing, so a readable socket
+        # means it closed the connection (e.g. FreeCAD was restarted)
+        readable, _, _ = select.select([self._sock], [], [], 0)
+        return bool(readable)
+
+    def _receive(self) -> dict:
+        size = int.from_bytes(self._read_exactly(HEADER_SIZE), "little")
+        return json.loads(self._read_exactly(size))
+
+    def request(self, tool_name: str, args: dict) -> dict:
+        """Send one tool call and return the decoded response."""
+        message = json.dumps({"tool": tool_name, "arguments": args}).encode("utf-8")
+        frame = len(message).to_bytes(HEADER_SIZE, "little") + message
+        if self._sock is not None and self._is_stale():
+            self._close()
+        reconnected = self._sock is None
+        if reconnected:
+            self._connect()
+        try:
+            try:
+                self._sock.sendall(frame)
+            except ConnectionError:
+                # Only a failed send is retried: once the call is out,
+                # FreeCAD may already have run it
+                self._close()
+                if reconnected:
+                    raise
+                self._connect()
+                self._sock.sendall(frame)
+            return self._receive()
+        except BaseException:
+            # Timeout mid-exchange: the stream is out of sync
+            self._close()
+            raise
+
+
+_json_connection = _JSONConnection(FREECAD_HOST, FREECAD_JSON_PORT)
+
+
+_rpc = None
 
 
 def get_rpc() -> xmlrpc.client.ServerProxy:
-    return xmlrpc.client.ServerProxy(f"http://{FREECAD_HOST}:{FREECAD_PORT}")
+    # One proxy for the process: its transport keeps the HTTP/1.1
+    # connection to the addon open between calls
+    global _rpc
+    if _rpc is None:
+        _rpc = xmlrpc.client.ServerProxy(f"http://{FREECAD_HOST}:{FREECAD_PORT}")
+    return _rpc
 
 
 server = Server("freecad-mcp")
 
 
+# Set once the JSON port was refused but XML-RPC answered (an addon
+# without the JSON listener); later calls then go straight to XML-RPC
+_json_unavailable = False
+
+
 def _call_addon(tool_name: str, args: dict) -> dict:
-    """Call addon via XML-RPC and parse response."""
+    """Call addon over its JSON listener, or via XML-RPC if it has none."""
+    global _json_unavailable
+    if not _json_unavailable:
+        try:
+            return _json_connection.request(tool_name, args)
+        except ConnectionRefusedError:
+            pass  # Addon without the JSON listener; fall back to XML-RPC
     client = get_rpc()
     raw = client.execute_tool(tool_name, json.dumps(args))
+    _json_unavailable = True
     return json.loads(raw)
 
 
@@ -69,6 +164,11 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Specific object (optional, empty for all)",
                     },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["dimensions", "edges", "faces"]},
+                        "description": "Shape data to compute per object (default all); [] lists names, labels and types only",
+                    },
                 },
             },
         ),